@@ -31,3 +31,9 @@ class UserDomainObjectTests(unittest.TestCase):
         user = User(user_id='123-456', name='foo')
         self.assertEqual('foo', user.name)
         self.assertEqual('123-456', user.id)
+
+    def test_hashable(self):
+        users = {User('foo', '123-456'), User('foo', '123-456'),
+                 User('bar', '789')}
+        self.assertEqual(2, len(users))
+        self.assertIn(User(user_id='123-456', name='foo'), users)
@@ -48,6 +48,26 @@ class VolumeTypeDomainObjectTests(unittest.TestCase):
         self.assertEqual(encryption, volume_type.encryption)
         self.assertEqual(qos_spec, volume_type.qos_spec)
 
+    def test_equality(self):
+        encryption = VolumeTypeEncryption(
+            'id-encrypt1', 'id-vol-type1', 'loc1', 'provider1', 'cipher1', 99)
+        qos_spec = QoSSpec('name', 'id', 'consumer')
+
+        volume_type = VolumeType('name', 'id', True, encryption, qos_spec)
+        self.assertEqual(volume_type, volume_type)
+        self.assertEqual(
+            VolumeType('name', 'id', True, encryption, qos_spec), volume_type)
+        self.assertNotEqual(qos_spec, volume_type)
+        self.assertNotEqual(None, volume_type)
+
+    def test_hashable(self):
+        volume_types = {VolumeType('name', 'id', True, None, None),
+                        VolumeType('name', 'id', True, None, None),
+                        VolumeType('name2', 'id2', False, None, None)}
+        self.assertEqual(2, len(volume_types))
+        self.assertIn(VolumeType('name', 'id', True, None, None),
+                      volume_types)
+
 
 class VolumeTypeEncryptionObjectTests(unittest.TestCase):
     """
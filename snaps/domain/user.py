@@ -14,11 +14,13 @@
 # limitations under the License.
 
 
-class User:
+class User(object):
     """
     SNAPS domain object for Users. Should contain attributes that
     are shared amongst cloud providers
     """
+    __slots__ = ('name', 'id')
+
     def __init__(self, name, user_id):
         """
         Constructor
@@ -29,4 +31,11 @@ class User:
         self.id = user_id
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return self.name == other.name and self.id == other.id
+
+    def __hash__(self):
+        return hash((self.name, self.id))
@@ -14,11 +14,13 @@
 # limitations under the License.
 
 
-class VolumeType:
+class VolumeType(object):
     """
     SNAPS domain object for Volume Types. Should contain attributes that
     are shared amongst cloud providers
     """
+    __slots__ = ('name', 'id', 'public', 'encryption', 'qos_spec')
+
     def __init__(self, name, volume_type_id, public, encryption, qos_spec):
         """
         Constructor
@@ -35,17 +37,27 @@ class VolumeType:
         self.qos_spec = qos_spec
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return (self.name == other.name and self.id == other.id
                 and self.public == other.public
                 and self.encryption == other.encryption
                 and self.qos_spec == other.qos_spec)
 
+    def __hash__(self):
+        return hash((self.name, self.id))
+
 
-class VolumeTypeEncryption:
+class VolumeTypeEncryption(object):
     """
     SNAPS domain object for Volume Types. Should contain attributes that
     are shared amongst cloud providers
     """
+    __slots__ = ('id', 'volume_type_id', 'control_location', 'provider',
+                 'cipher', 'key_size')
+
     def __init__(self, volume_encryption_id, volume_type_id,
                  control_location, provider, cipher, key_size):
         """
@@ -65,6 +77,10 @@ class VolumeTypeEncryption:
         self.key_size = key_size
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return (self.id == other.id
                 and self.volume_type_id == other.volume_type_id
                 and self.control_location == other.control_location
@@ -72,12 +88,17 @@ class VolumeTypeEncryption:
                 and self.cipher == other.cipher
                 and self.key_size == other.key_size)
 
+    def __hash__(self):
+        return hash((self.id, self.volume_type_id))
 
-class QoSSpec:
+
+class QoSSpec(object):
     """
     SNAPS domain object for Volume Types. Should contain attributes that
     are shared amongst cloud providers
     """
+    __slots__ = ('name', 'id', 'consumer')
+
     def __init__(self, name, spec_id, consumer):
         """
         Constructor
@@ -89,5 +110,12 @@ class QoSSpec:
         self.consumer = consumer
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return (self.name == other.name and self.id == other.id
                 and self.consumer == other.consumer)
+
+    def __hash__(self):
+        return hash((self.name, self.id))
@@ -12,8 +12,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import errno
 import os
 import logging
+import shutil
 
 from cryptography.hazmat.primitives import serialization
 
@@ -32,6 +34,9 @@ Utilities for basic file handling
 
 logger = logging.getLogger('file_utils')
 
+# Size of the chunks in which downloads are copied to disk
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
 
 def file_exists(file_path):
     """
@@ -72,7 +77,11 @@ def download(url, dest_path, name=None):
             logger.debug('Saving file to - %s',
                          os.path.abspath(download_file.name))
             response = __get_url_response(url)
-            download_file.write(response.read())
+            try:
+                shutil.copyfileobj(response, download_file,
+                                   DOWNLOAD_BUFFER_SIZE)
+            finally:
+                response.close()
         return download_file
     finally:
         if download_file:
@@ -90,44 +99,23 @@ def save_keys_to_files(keys=None, pub_file_path=None, priv_file_path=None):
         if pub_file_path:
             # To support '~'
             pub_expand_file = os.path.expanduser(pub_file_path)
-            pub_dir = os.path.dirname(pub_expand_file)
-
-            if not os.path.isdir(pub_dir):
-                os.mkdir(pub_dir)
-
-            public_handle = None
-            try:
-                public_handle = open(pub_expand_file, 'wb')
-                public_bytes = keys.public_key().public_bytes(
-                    serialization.Encoding.OpenSSH,
-                    serialization.PublicFormat.OpenSSH)
-                public_handle.write(public_bytes)
-            finally:
-                if public_handle:
-                    public_handle.close()
+            __create_parent_dir(pub_expand_file)
 
-            os.chmod(pub_expand_file, 0o400)
+            public_bytes = keys.public_key().public_bytes(
+                serialization.Encoding.OpenSSH,
+                serialization.PublicFormat.OpenSSH)
+            __write_protected(pub_expand_file, public_bytes, 0o400)
             logger.info("Saved public key to - " + pub_expand_file)
         if priv_file_path:
             # To support '~'
             priv_expand_file = os.path.expanduser(priv_file_path)
-            priv_dir = os.path.dirname(priv_expand_file)
-            if not os.path.isdir(priv_dir):
-                os.mkdir(priv_dir)
+            __create_parent_dir(priv_expand_file)
 
-            private_handle = None
-            try:
-                private_handle = open(priv_expand_file, 'wb')
-                private_handle.write(
-                    keys.private_bytes(
-                        encoding=serialization.Encoding.PEM,
-                        format=serialization.PrivateFormat.TraditionalOpenSSL,
-                        encryption_algorithm=serialization.NoEncryption()))
-            finally:
-                if private_handle:
-                    private_handle.close()
-
-            os.chmod(priv_expand_file, 0o400)
+            private_bytes = keys.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.TraditionalOpenSSL,
+                encryption_algorithm=serialization.NoEncryption())
+            __write_protected(priv_expand_file, private_bytes, 0o400)
             logger.info("Saved private key to - " + priv_expand_file)
 
 
@@ -159,6 +147,50 @@ def get_content_length(url):
     return response.headers['Content-Length']
 
 
+def make_dirs(dir_path):
+    """
+    Creates a directory along with any missing parent directories. Unlike
+    os.makedirs(), an existing directory is not an error
+    :param dir_path: the path of the directory to create
+    :raise OSError: when the directory cannot be created or the path exists
+                    but is not a directory
+    """
+    try:
+        os.makedirs(dir_path)
+    except OSError as e:
+        if e.errno != errno.EEXIST or not os.path.isdir(dir_path):
+            raise
+
+
+def __create_parent_dir(file_path):
+    """
+    Creates the directory that will contain file_path along with any missing
+    parent directories
+    :param file_path: the path of the file about to be written
+    """
+    dir_path = os.path.dirname(file_path)
+    if dir_path:
+        make_dirs(dir_path)
+
+
+def __write_protected(file_path, data, mode):
+    """
+    Writes data to file_path which is given its permissions before any of the
+    data is written so it is never readable by others, even for a moment
+    :param file_path: the path of the file to write
+    :param data: the bytes to write
+    :param mode: the file's permission bits
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        # The mode above is only applied when the file is being created
+        os.fchmod(fd, mode)
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
 def __get_url_response(url):
     """
     Returns a response object for a given URL
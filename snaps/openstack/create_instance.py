@@ -30,6 +30,7 @@ __author__ = 'spisarski'
 logger = logging.getLogger('create_instance')
 
 POLL_INTERVAL = 3
+INITIAL_POLL_INTERVAL = 0.25
 STATUS_ACTIVE = 'ACTIVE'
 STATUS_DELETED = 'DELETED'
 
@@ -555,7 +556,9 @@ class OpenStackVmInstance(OpenStackComputeObject):
         :param block: When true, thread will block until active or timeout
                       value in seconds has been exceeded (False)
         :param timeout: The timeout value
-        :param poll_interval: The polling interval in seconds
+        :param poll_interval: The maximum polling interval in seconds, the
+                              interval starts at INITIAL_POLL_INTERVAL and
+                              doubles after each query until reaching it
         :return: T/F
         """
         # sleep and wait for VM status change
@@ -564,6 +567,7 @@ class OpenStackVmInstance(OpenStackComputeObject):
         else:
             return self.__status(expected_status_code)
 
+        sleep_time = min(INITIAL_POLL_INTERVAL, poll_interval)
         while timeout > time.time() - start:
             status = self.__status(expected_status_code)
             if status:
@@ -571,8 +575,9 @@ class OpenStackVmInstance(OpenStackComputeObject):
                 return True
 
             logger.debug('Retry querying VM status in ' + str(
-                poll_interval) + ' seconds')
-            time.sleep(poll_interval)
+                sleep_time) + ' seconds')
+            time.sleep(sleep_time)
+            sleep_time = min(sleep_time * 2, poll_interval)
             logger.debug('VM status query timeout in ' + str(
                 timeout - (time.time() - start)))
 
@@ -611,7 +616,9 @@ class OpenStackVmInstance(OpenStackComputeObject):
         Returns true when the VM can be accessed via SSH
         :param block: When true, thread will block until active or timeout
                       value in seconds has been exceeded (False)
-        :param poll_interval: The polling interval
+        :param poll_interval: The maximum polling interval in seconds, the
+                              interval starts at INITIAL_POLL_INTERVAL and
+                              doubles after each attempt until reaching it
         :return: T/F
         """
         # sleep and wait for VM status change
@@ -625,6 +632,7 @@ class OpenStackVmInstance(OpenStackComputeObject):
             else:
                 start = time.time() - timeout
 
+            sleep_time = min(INITIAL_POLL_INTERVAL, poll_interval)
             while timeout > time.time() - start:
                 status = self.__ssh_active()
                 if status:
@@ -632,8 +640,9 @@ class OpenStackVmInstance(OpenStackComputeObject):
                     return True
 
                 logger.debug('Retry SSH connection in ' + str(
-                    poll_interval) + ' seconds')
-                time.sleep(poll_interval)
+                    sleep_time) + ' seconds')
+                time.sleep(sleep_time)
+                sleep_time = min(sleep_time * 2, poll_interval)
                 logger.debug('SSH connection timeout in ' + str(
                     timeout - (time.time() - start)))
 
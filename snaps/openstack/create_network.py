@@ -14,6 +14,7 @@
 # limitations under the License.
 import logging
 
+import netaddr
 from neutronclient.common.exceptions import NotFound
 
 from snaps.openstack.openstack_creator import OpenStackNetworkObject
@@ -484,6 +485,38 @@ class PortSettings:
                         'Invalid port configuration, subnet does not exist '
                         'with name - ' + ip_addr_dict['subnet_name'])
 
+    def __validate_addresses(self):
+        """
+        Raises a PortSettingsError when any of the configured MAC or IP
+        addresses is malformed so the error is caught before calling Neutron
+        :return: None
+        """
+        if self.mac_address and not netaddr.valid_mac(self.mac_address):
+            raise PortSettingsError(
+                'Invalid MAC address - ' + str(self.mac_address))
+
+        if self.ip_addrs:
+            for ip_addr_dict in self.ip_addrs:
+                ip = ip_addr_dict.get('ip')
+                if ip and not (netaddr.valid_ipv4(ip) or
+                               netaddr.valid_ipv6(ip)):
+                    raise PortSettingsError('Invalid IP address - ' + str(ip))
+
+        if self.allowed_address_pairs:
+            for pair in self.allowed_address_pairs:
+                mac_addr = pair.get('mac_address')
+                if mac_addr and not netaddr.valid_mac(mac_addr):
+                    raise PortSettingsError(
+                        'Invalid allowed address pair MAC address - ' +
+                        str(mac_addr))
+                try:
+                    # Neutron also accepts CIDRs for the pair's address
+                    netaddr.IPNetwork(pair.get('ip_address'))
+                except (netaddr.AddrFormatError, TypeError, ValueError):
+                    raise PortSettingsError(
+                        'Invalid allowed address pair IP address - ' +
+                        str(pair.get('ip_address')))
+
     def dict_for_neutron(self, neutron, os_creds):
         """
         Returns a dictionary object representing this object.
@@ -494,7 +527,9 @@ class PortSettings:
         :param neutron: the Neutron client
         :param os_creds: the OpenStack credentials
         :return: the dictionary object
+        :raise PortSettingsError: when a MAC or IP address is malformed
         """
+        self.__validate_addresses()
         self.__set_fixed_ips(neutron)
 
         out = dict()
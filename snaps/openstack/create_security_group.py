@@ -95,14 +95,7 @@ class OpenStackSecurityGroup(OpenStackNetworkObject):
                 ctr += 1
 
             # Create the custom rules
-            for sec_grp_rule_setting in self.sec_grp_settings.rule_settings:
-                try:
-                    custom_rule = neutron_utils.create_security_group_rule(
-                        self._neutron, sec_grp_rule_setting)
-                    self.__rules[sec_grp_rule_setting] = custom_rule
-                except Conflict as e:
-                    logger.warn('Unable to create rule due to conflict - %s',
-                                e)
+            self.__create_rules(self.sec_grp_settings.rule_settings)
 
             # Refresh security group object to reflect the new rules added
             self.__security_group = neutron_utils.get_security_group(
@@ -110,6 +103,37 @@ class OpenStackSecurityGroup(OpenStackNetworkObject):
 
         return self.__security_group
 
+    def __create_rules(self, rule_settings):
+        """
+        Creates the custom rules with a single bulk request. As Neutron
+        rejects the whole request when any rule conflicts with an existing
+        one, the rules are then created one at a time so only the conflicting
+        ones are skipped
+        :param rule_settings: the list of SecurityGroupRuleSettings objects
+        """
+        if not rule_settings:
+            return
+
+        try:
+            custom_rules = neutron_utils.create_security_group_rules(
+                self._neutron, rule_settings)
+            for sec_grp_rule_setting, custom_rule in zip(rule_settings,
+                                                         custom_rules):
+                self.__rules[sec_grp_rule_setting] = custom_rule
+            return
+        except Conflict as e:
+            logger.warning(
+                'Unable to create rules in bulk due to conflict, creating '
+                'them individually - %s', e)
+
+        for sec_grp_rule_setting in rule_settings:
+            try:
+                custom_rule = neutron_utils.create_security_group_rule(
+                    self._neutron, sec_grp_rule_setting)
+                self.__rules[sec_grp_rule_setting] = custom_rule
+            except Conflict as e:
+                logger.warn('Unable to create rule due to conflict - %s', e)
+
     def __generate_rule_setting(self, rule):
         """
         Creates a SecurityGroupRuleSettings object for a given rule
@@ -17,7 +17,6 @@ import logging
 
 import enum
 from cinderclient.exceptions import NotFound
-from neutronclient.common.utils import str2bool
 
 from snaps.openstack.openstack_creator import OpenStackVolumeObject
 from snaps.openstack.utils import cinder_utils
@@ -39,7 +38,7 @@ class OpenStackVolumeType(OpenStackVolumeObject):
         :param volume_type_settings: The volume type settings
         :return:
         """
-        super(self.__class__, self).__init__(os_creds)
+        super(OpenStackVolumeType, self).__init__(os_creds)
 
         self.volume_type_settings = volume_type_settings
         self.__volume_type = None
@@ -49,27 +48,52 @@ class OpenStackVolumeType(OpenStackVolumeObject):
         Loads the existing Volume
         :return: The Volume domain object or None
         """
-        super(self.__class__, self).initialize()
+        super(OpenStackVolumeType, self).initialize()
 
         self.__volume_type = cinder_utils.get_volume_type(
             self._cinder, volume_type_settings=self.volume_type_settings)
 
         return self.__volume_type
 
+    @classmethod
+    def initialize_many(cls, os_creds, volume_type_settings_list):
+        """
+        Creates and loads a creator for each volume type settings object
+        with a single list call to Cinder
+        :param os_creds: The OpenStack connection credentials
+        :param volume_type_settings_list: a list of VolumeTypeSettings objects
+        :return: a list of initialized OpenStackVolumeType objects in the same
+                 order as volume_type_settings_list
+        """
+        cinder = cinder_utils.cinder_client(os_creds)
+        volume_types = cinder_utils.get_volume_types(
+            cinder, [settings.name for settings in volume_type_settings_list])
+
+        out = list()
+        for settings in volume_type_settings_list:
+            creator = cls(os_creds, settings)
+            creator._cinder = cinder
+            creator.__volume_type = volume_types.get(settings.name)
+            out.append(creator)
+        return out
+
     def create(self, block=False):
         """
         Creates the volume in OpenStack if it does not already exist and
         returns the domain Volume object
         :return: The Volume domain object or None
         """
-        self.initialize()
-
         if not self.__volume_type:
-            self.__volume_type = cinder_utils.create_volume_type(
-                self._cinder, self.volume_type_settings)
-            logger.info(
-                'Created volume type with name - %s',
-                self.volume_type_settings.name)
+            # Only query Cinder when this creator does not already hold the
+            # volume type from a previous initialize() or create() call
+            self.initialize()
+
+            if not self.__volume_type:
+                self.__volume_type = cinder_utils.create_volume_type(
+                    self._cinder, self.volume_type_settings)
+                logger.info(
+                    'Created volume type with name - %s',
+                    self.volume_type_settings.name)
 
         return self.__volume_type
 
@@ -115,28 +139,29 @@ class VolumeTypeSettings:
         self.description = kwargs.get('description')
         self.qos_spec_name = kwargs.get('qos_spec_name')
 
-        if 'encryption' in kwargs:
-            if isinstance(kwargs['encryption'], dict):
-                self.encryption = VolumeTypeEncryptionSettings(
-                    **kwargs['encryption'])
-            elif isinstance(kwargs['encryption'],
-                            VolumeTypeEncryptionSettings):
-                self.encryption = kwargs['encryption']
+        encryption = kwargs.get('encryption')
+        if isinstance(encryption, dict):
+            self.encryption = VolumeTypeEncryptionSettings(**encryption)
+        elif isinstance(encryption, VolumeTypeEncryptionSettings):
+            self.encryption = encryption
         else:
             self.encryption = None
 
-        if 'public' in kwargs:
-            if isinstance(kwargs['public'], str):
-                self.public = str2bool(kwargs['public'])
-            else:
-                self.public = kwargs['public']
+        public = kwargs.get('public', False)
+        if isinstance(public, str):
+            # same semantics as neutronclient's str2bool without importing it
+            self.public = public.lower() == 'true'
         else:
-            self.public = False
+            self.public = public
 
         if not self.name:
             raise VolumeTypeSettingsError("The attribute name is required")
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return (self.name == other.name
                 and self.description == other.description
                 and self.qos_spec_name == other.qos_spec_name
@@ -144,14 +169,20 @@ class VolumeTypeSettings:
                 and self.public == other.public)
 
 
-class ControlLocation(enum.Enum):
+class ControlLocation(str, enum.Enum):
     """
-    QoS Specification consumer types
+    QoS Specification consumer types. Members are also str instances so they
+    compare equal to and serialize as their values
     """
     front_end = 'front-end'
     back_end = 'back-end'
 
 
+_CONTROL_LOCATION_MAP = dict(
+    (control_location.value, control_location)
+    for control_location in ControlLocation)
+
+
 class VolumeTypeEncryptionSettings:
     def __init__(self, **kwargs):
         """
@@ -188,6 +219,10 @@ class VolumeTypeEncryptionSettings:
                 'are required')
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return (self.name == other.name
                 and self.provider_class == other.provider_class
                 and self.control_location == other.control_location
@@ -209,11 +244,9 @@ def map_control_location(control_location):
         return control_location
     else:
         proto_str = str(control_location)
-        if proto_str == 'front-end':
-            return ControlLocation.front_end
-        elif proto_str == 'back-end':
-            return ControlLocation.back_end
-        else:
+        try:
+            return _CONTROL_LOCATION_MAP[proto_str]
+        except KeyError:
             raise VolumeTypeSettingsError('Invalid Consumer - ' + proto_str)
 
 
@@ -222,14 +255,8 @@ class VolumeTypeSettingsError(Exception):
     Exception to be thrown when an volume settings are incorrect
     """
 
-    def __init__(self, message):
-        Exception.__init__(self, message)
-
 
 class VolumeTypeCreationError(Exception):
     """
     Exception to be thrown when an volume cannot be created
     """
-
-    def __init__(self, message):
-        Exception.__init__(self, message)
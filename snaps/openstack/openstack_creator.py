@@ -125,7 +125,10 @@ class OpenStackVolumeObject(OpenStackCloudObject):
         self._cinder = None
 
     def initialize(self):
-        self._cinder = cinder_utils.cinder_client(self._os_creds)
+        # the client's keystone session re-authenticates when necessary, so
+        # reuse it across operations instead of obtaining a new token each time
+        if not self._cinder:
+            self._cinder = cinder_utils.cinder_client(self._os_creds)
 
     def create(self):
         raise NotImplementedError('Do not override abstract method')
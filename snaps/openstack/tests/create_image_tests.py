@@ -271,8 +271,7 @@ class CreateImageSuccessTests(OSIntegrationTestCase):
             glance_test_meta = None
 
         self.tmp_dir = 'tmp/' + str(guid)
-        if not os.path.exists(self.tmp_dir):
-            os.makedirs(self.tmp_dir)
+        file_utils.make_dirs(self.tmp_dir)
 
         self.image_settings = openstack_tests.cirros_image_settings(
             name=self.image_name,
@@ -561,8 +560,7 @@ class CreateMultiPartImageTests(OSIntegrationTestCase):
         self.glance = glance_utils.glance_client(self.os_creds)
 
         self.tmp_dir = 'tmp/' + str(guid)
-        if not os.path.exists(self.tmp_dir):
-            os.makedirs(self.tmp_dir)
+        file_utils.make_dirs(self.tmp_dir)
 
         if self.image_metadata and 'glance_tests' in self.image_metadata:
             self.glance_test_meta = self.image_metadata['glance_tests']
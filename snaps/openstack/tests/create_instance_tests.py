@@ -12,9 +12,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import atexit
+import errno
+import itertools
 import logging
 import re
 import shutil
+import threading
 import time
 import unittest
 import uuid
@@ -23,7 +27,6 @@ import os
 from neutronclient.common.exceptions import InvalidIpForSubnetClient
 
 from snaps import file_utils
-from snaps.openstack import create_network, create_router
 from snaps.openstack.create_flavor import OpenStackFlavor, FlavorSettings
 from snaps.openstack.create_image import OpenStackImage, ImageSettings
 from snaps.openstack.create_instance import (
@@ -31,15 +34,15 @@ from snaps.openstack.create_instance import (
     VmInstanceSettingsError, FloatingIpSettingsError)
 from snaps.openstack.create_keypairs import OpenStackKeypair, KeypairSettings
 from snaps.openstack.create_network import (
-    OpenStackNetwork, PortSettings, NetworkSettings)
+    OpenStackNetwork, PortSettings, NetworkSettings, SubnetSettings)
 from snaps.openstack.create_router import OpenStackRouter, RouterSettings
 from snaps.openstack.create_security_group import (
     SecurityGroupSettings, OpenStackSecurityGroup, SecurityGroupRuleSettings,
     Direction, Protocol)
 from snaps.openstack.tests import openstack_tests, validation_utils
 from snaps.openstack.tests.os_source_file_test import (
-    OSIntegrationTestCase, OSComponentTestCase)
-from snaps.openstack.utils import nova_utils
+    OSIntegrationTestCase, OSComponentTestCase, dev_os_env_file)
+from snaps.openstack.utils import glance_utils, nova_utils
 
 __author__ = 'spisarski'
 
@@ -48,129 +51,114 @@ VM_BOOT_TIMEOUT = 600
 logger = logging.getLogger('create_instance_tests')
 
 
-class VmInstanceSettingsUnitTests(unittest.TestCase):
-    """
-    Tests the construction of the VmInstanceSettings class
-    """
+# Unique per process so names do not clash with objects leaked by other runs
+_RUN_ID = uuid.uuid4().hex[:8]
+_guid_counter = itertools.count()
 
-    def test_no_params(self):
-        with self.assertRaises(VmInstanceSettingsError):
-            VmInstanceSettings()
+# The image and flavor creators shared by the tests of each
+# _SharedImageFlavorTestCase subclass keyed by the class
+_shared_image_flavors = dict()
 
-    def test_empty_config(self):
-        with self.assertRaises(VmInstanceSettingsError):
-            VmInstanceSettings(config=dict())
 
-    def test_name_only(self):
-        with self.assertRaises(VmInstanceSettingsError):
-            VmInstanceSettings(name='foo')
+def _guid(test_class):
+    """
+    Returns the unique prefix from which a test derives the names of all of
+    the OpenStack objects it creates
+    :param test_class: the test's class
+    :return: the guid string
+    """
+    return (test_class.__name__ + '-' + _RUN_ID + '-' +
+            str(next(_guid_counter)))
 
-    def test_config_with_name_only(self):
-        with self.assertRaises(VmInstanceSettingsError):
-            VmInstanceSettings(config={'name': 'foo'})
 
-    def test_name_flavor_only(self):
-        with self.assertRaises(VmInstanceSettingsError):
-            VmInstanceSettings(name='foo', flavor='bar')
+class VmInstanceSettingsUnitTests(unittest.TestCase):
+    """
+    Tests the construction of the VmInstanceSettings class
+    """
 
-    def test_config_with_name_flavor_only(self):
-        with self.assertRaises(VmInstanceSettingsError):
-            VmInstanceSettings(config={'name': 'foo', 'flavor': 'bar'})
+    def test_invalid_params(self):
+        invalid_kwargs = [
+            dict(),
+            {'config': dict()},
+            {'name': 'foo'},
+            {'config': {'name': 'foo'}},
+            {'name': 'foo', 'flavor': 'bar'},
+            {'config': {'name': 'foo', 'flavor': 'bar'}}]
+        for kwargs in invalid_kwargs:
+            with self.assertRaises(VmInstanceSettingsError):
+                VmInstanceSettings(**kwargs)
+
+    @staticmethod
+    def __settings_dict(settings):
+        """
+        Returns the values of a VmInstanceSettings object being validated as a
+        dict so they can be compared with a single assertion
+        :param settings: the VmInstanceSettings object
+        :return: a dict
+        """
+        return {
+            'name': settings.name,
+            'flavor': settings.flavor,
+            'ports': [(port_settings.name, port_settings.network_name)
+                      for port_settings in settings.port_settings],
+            'security_group_names': list(settings.security_group_names),
+            'floating_ips': [
+                (fip_settings.name, fip_settings.port_name,
+                 fip_settings.router_name)
+                for fip_settings in settings.floating_ip_settings],
+            'sudo_user': settings.sudo_user,
+            'vm_boot_timeout': settings.vm_boot_timeout,
+            'vm_delete_timeout': settings.vm_delete_timeout,
+            'ssh_connect_timeout': settings.ssh_connect_timeout,
+            'availability_zone': settings.availability_zone}
 
     def test_name_flavor_port_only(self):
         port_settings = PortSettings(name='foo-port', network_name='bar-net')
-        settings = VmInstanceSettings(name='foo', flavor='bar',
-                                      port_settings=[port_settings])
-        self.assertEqual('foo', settings.name)
-        self.assertEqual('bar', settings.flavor)
-        self.assertEqual(1, len(settings.port_settings))
-        self.assertEqual('foo-port', settings.port_settings[0].name)
-        self.assertEqual('bar-net', settings.port_settings[0].network_name)
-        self.assertEqual(0, len(settings.security_group_names))
-        self.assertEqual(0, len(settings.floating_ip_settings))
-        self.assertIsNone(settings.sudo_user)
-        self.assertEqual(900, settings.vm_boot_timeout)
-        self.assertEqual(300, settings.vm_delete_timeout)
-        self.assertEqual(180, settings.ssh_connect_timeout)
-        self.assertIsNone(settings.availability_zone)
-
-    def test_config_with_name_flavor_port_only(self):
-        port_settings = PortSettings(name='foo-port', network_name='bar-net')
-        settings = VmInstanceSettings(
-            **{'name': 'foo', 'flavor': 'bar', 'ports': [port_settings]})
-        self.assertEqual('foo', settings.name)
-        self.assertEqual('bar', settings.flavor)
-        self.assertEqual(1, len(settings.port_settings))
-        self.assertEqual('foo-port', settings.port_settings[0].name)
-        self.assertEqual('bar-net', settings.port_settings[0].network_name)
-        self.assertEqual(0, len(settings.security_group_names))
-        self.assertEqual(0, len(settings.floating_ip_settings))
-        self.assertIsNone(settings.sudo_user)
-        self.assertEqual(900, settings.vm_boot_timeout)
-        self.assertEqual(300, settings.vm_delete_timeout)
-        self.assertEqual(180, settings.ssh_connect_timeout)
-        self.assertIsNone(settings.availability_zone)
+        settings_list = [
+            VmInstanceSettings(name='foo', flavor='bar',
+                               port_settings=[port_settings]),
+            VmInstanceSettings(
+                **{'name': 'foo', 'flavor': 'bar', 'ports': [port_settings]})]
+        expected = {
+            'name': 'foo', 'flavor': 'bar',
+            'ports': [('foo-port', 'bar-net')], 'security_group_names': [],
+            'floating_ips': [], 'sudo_user': None, 'vm_boot_timeout': 900,
+            'vm_delete_timeout': 300, 'ssh_connect_timeout': 180,
+            'availability_zone': None}
+        for settings in settings_list:
+            self.assertEqual(expected, self.__settings_dict(settings))
 
     def test_all(self):
         port_settings = PortSettings(name='foo-port', network_name='bar-net')
         fip_settings = FloatingIpSettings(name='foo-fip', port_name='bar-port',
                                           router_name='foo-bar-router')
 
-        settings = VmInstanceSettings(name='foo', flavor='bar',
-                                      port_settings=[port_settings],
-                                      security_group_names=['sec_grp_1'],
-                                      floating_ip_settings=[fip_settings],
-                                      sudo_user='joe', vm_boot_timeout=999,
-                                      vm_delete_timeout=333,
-                                      ssh_connect_timeout=111,
-                                      availability_zone='server name')
-        self.assertEqual('foo', settings.name)
-        self.assertEqual('bar', settings.flavor)
-        self.assertEqual(1, len(settings.port_settings))
-        self.assertEqual('foo-port', settings.port_settings[0].name)
-        self.assertEqual('bar-net', settings.port_settings[0].network_name)
-        self.assertEqual(1, len(settings.security_group_names))
-        self.assertEqual('sec_grp_1', settings.security_group_names[0])
-        self.assertEqual(1, len(settings.floating_ip_settings))
-        self.assertEqual('foo-fip', settings.floating_ip_settings[0].name)
-        self.assertEqual('bar-port',
-                         settings.floating_ip_settings[0].port_name)
-        self.assertEqual('foo-bar-router',
-                         settings.floating_ip_settings[0].router_name)
-        self.assertEqual('joe', settings.sudo_user)
-        self.assertEqual(999, settings.vm_boot_timeout)
-        self.assertEqual(333, settings.vm_delete_timeout)
-        self.assertEqual(111, settings.ssh_connect_timeout)
-        self.assertEqual('server name', settings.availability_zone)
-
-    def test_config_all(self):
-        port_settings = PortSettings(name='foo-port', network_name='bar-net')
-        fip_settings = FloatingIpSettings(name='foo-fip', port_name='bar-port',
-                                          router_name='foo-bar-router')
-
-        settings = VmInstanceSettings(
-            **{'name': 'foo', 'flavor': 'bar', 'ports': [port_settings],
-               'security_group_names': ['sec_grp_1'],
-               'floating_ips': [fip_settings], 'sudo_user': 'joe',
-               'vm_boot_timeout': 999, 'vm_delete_timeout': 333,
-               'ssh_connect_timeout': 111, 'availability_zone': 'server name'})
-        self.assertEqual('foo', settings.name)
-        self.assertEqual('bar', settings.flavor)
-        self.assertEqual(1, len(settings.port_settings))
-        self.assertEqual('foo-port', settings.port_settings[0].name)
-        self.assertEqual('bar-net', settings.port_settings[0].network_name)
-        self.assertEqual(1, len(settings.security_group_names))
-        self.assertEqual(1, len(settings.floating_ip_settings))
-        self.assertEqual('foo-fip', settings.floating_ip_settings[0].name)
-        self.assertEqual('bar-port',
-                         settings.floating_ip_settings[0].port_name)
-        self.assertEqual('foo-bar-router',
-                         settings.floating_ip_settings[0].router_name)
-        self.assertEqual('joe', settings.sudo_user)
-        self.assertEqual(999, settings.vm_boot_timeout)
-        self.assertEqual(333, settings.vm_delete_timeout)
-        self.assertEqual(111, settings.ssh_connect_timeout)
-        self.assertEqual('server name', settings.availability_zone)
+        settings_list = [
+            VmInstanceSettings(name='foo', flavor='bar',
+                               port_settings=[port_settings],
+                               security_group_names=['sec_grp_1'],
+                               floating_ip_settings=[fip_settings],
+                               sudo_user='joe', vm_boot_timeout=999,
+                               vm_delete_timeout=333,
+                               ssh_connect_timeout=111,
+                               availability_zone='server name'),
+            VmInstanceSettings(
+                **{'name': 'foo', 'flavor': 'bar', 'ports': [port_settings],
+                   'security_group_names': ['sec_grp_1'],
+                   'floating_ips': [fip_settings], 'sudo_user': 'joe',
+                   'vm_boot_timeout': 999, 'vm_delete_timeout': 333,
+                   'ssh_connect_timeout': 111,
+                   'availability_zone': 'server name'})]
+        expected = {
+            'name': 'foo', 'flavor': 'bar',
+            'ports': [('foo-port', 'bar-net')],
+            'security_group_names': ['sec_grp_1'],
+            'floating_ips': [('foo-fip', 'bar-port', 'foo-bar-router')],
+            'sudo_user': 'joe', 'vm_boot_timeout': 999,
+            'vm_delete_timeout': 333, 'ssh_connect_timeout': 111,
+            'availability_zone': 'server name'}
+        for settings in settings_list:
+            self.assertEqual(expected, self.__settings_dict(settings))
 
 
 class FloatingIpSettingsUnitTests(unittest.TestCase):
@@ -178,68 +166,32 @@ class FloatingIpSettingsUnitTests(unittest.TestCase):
     Tests the construction of the FloatingIpSettings class
     """
 
-    def test_no_params(self):
-        with self.assertRaises(FloatingIpSettingsError):
-            FloatingIpSettings()
-
-    def test_empty_config(self):
-        with self.assertRaises(FloatingIpSettingsError):
-            FloatingIpSettings(**dict())
-
-    def test_name_only(self):
-        with self.assertRaises(FloatingIpSettingsError):
-            FloatingIpSettings(name='foo')
-
-    def test_config_with_name_only(self):
-        with self.assertRaises(FloatingIpSettingsError):
-            FloatingIpSettings(**{'name': 'foo'})
-
-    def test_name_port_only(self):
-        with self.assertRaises(FloatingIpSettingsError):
-            FloatingIpSettings(name='foo', port_name='bar')
-
-    def test_config_with_name_port_only(self):
-        with self.assertRaises(FloatingIpSettingsError):
-            FloatingIpSettings(**{'name': 'foo', 'port_name': 'bar'})
-
-    def test_name_router_only(self):
-        with self.assertRaises(FloatingIpSettingsError):
-            FloatingIpSettings(name='foo', router_name='bar')
-
-    def test_config_with_name_router_only(self):
-        with self.assertRaises(FloatingIpSettingsError):
-            FloatingIpSettings(**{'name': 'foo', 'router_name': 'bar'})
-
-    def test_name_port_router_name_only(self):
-        settings = FloatingIpSettings(name='foo', port_name='foo-port',
-                                      router_name='bar-router')
-        self.assertEqual('foo', settings.name)
-        self.assertEqual('foo-port', settings.port_name)
-        self.assertIsNone(settings.port_id)
-        self.assertEqual('bar-router', settings.router_name)
-        self.assertIsNone(settings.subnet_name)
-        self.assertTrue(settings.provisioning)
-
-    def test_name_port_router_id_only(self):
-        settings = FloatingIpSettings(name='foo', port_id='foo-port',
-                                      router_name='bar-router')
-        self.assertEqual('foo', settings.name)
-        self.assertEqual('foo-port', settings.port_id)
-        self.assertIsNone(settings.port_name)
-        self.assertEqual('bar-router', settings.router_name)
-        self.assertIsNone(settings.subnet_name)
-        self.assertTrue(settings.provisioning)
-
-    def test_config_with_name_port_router_only(self):
-        settings = FloatingIpSettings(
-            **{'name': 'foo', 'port_name': 'foo-port',
-               'router_name': 'bar-router'})
-        self.assertEqual('foo', settings.name)
-        self.assertEqual('foo-port', settings.port_name)
-        self.assertIsNone(settings.port_id)
-        self.assertEqual('bar-router', settings.router_name)
-        self.assertIsNone(settings.subnet_name)
-        self.assertTrue(settings.provisioning)
+    def test_invalid_params(self):
+        invalid_kwargs = [
+            dict(),
+            {'name': 'foo'},
+            {'name': 'foo', 'port_name': 'bar'},
+            {'name': 'foo', 'router_name': 'bar'}]
+        for kwargs in invalid_kwargs:
+            with self.assertRaises(FloatingIpSettingsError):
+                FloatingIpSettings(**kwargs)
+
+    def test_name_port_router_only(self):
+        settings_list = [
+            (FloatingIpSettings(name='foo', port_name='foo-port',
+                                router_name='bar-router'), 'foo-port', None),
+            (FloatingIpSettings(name='foo', port_id='foo-port',
+                                router_name='bar-router'), None, 'foo-port'),
+            (FloatingIpSettings(
+                **{'name': 'foo', 'port_name': 'foo-port',
+                   'router_name': 'bar-router'}), 'foo-port', None)]
+        for settings, port_name, port_id in settings_list:
+            self.assertEqual('foo', settings.name)
+            self.assertEqual(port_name, settings.port_name)
+            self.assertEqual(port_id, settings.port_id)
+            self.assertEqual('bar-router', settings.router_name)
+            self.assertIsNone(settings.subnet_name)
+            self.assertTrue(settings.provisioning)
 
     def test_all(self):
         settings = FloatingIpSettings(name='foo', port_name='foo-port',
@@ -266,7 +218,254 @@ class FloatingIpSettingsUnitTests(unittest.TestCase):
         self.assertFalse(settings.provisioning)
 
 
-class SimpleHealthCheck(OSIntegrationTestCase):
+class _SharedImageFlavorTestCase(OSIntegrationTestCase):
+    """
+    Super for integration test classes whose test methods can all use the same
+    Cirros image and flavor. Both are created with the admin credentials the
+    first time a test is setup and are cleaned once all of the class' tests
+    have completed, or at interpreter exit should tearDownClass() never be
+    called. A separate image and flavor are created for each distinct set of
+    metadata and flavor sizes so parameterize() instances of a class with
+    different image_metadata or flavor_metadata never share them.
+
+    The image is private to the admin project and is shared through Glance
+    image members with the project __start__() creates for each test so it is
+    never visible to the cloud's other tenants.
+    """
+
+    def _init_shared_image_flavor(self, ram=256, disk=10, vcpus=2):
+        """
+        Sets self.image_creator and self.flavor_creator to the image and
+        flavor shared by the class' tests with the same metadata, creating
+        them when they do not already exist. Must be called after __start__()
+        :param ram: the flavor's RAM in MB
+        :param disk: the flavor's disk size in GB
+        :param vcpus: the flavor's number of virtual CPUs
+        """
+        params = (self.image_metadata, self.flavor_metadata, ram, disk, vcpus)
+        entries = _shared_image_flavors.setdefault(self.__class__, list())
+
+        shared = None
+        for entry in entries:
+            if entry['params'] == params:
+                shared = entry
+                break
+        if not shared:
+            shared = {'params': params, 'image': None, 'flavor': None}
+            entries.append(shared)
+
+        guid = _guid(self.__class__)
+
+        if not shared['image']:
+            os_image_settings = openstack_tests.cirros_image_settings(
+                name=guid + '-image', image_metadata=self.image_metadata,
+                use_local_file=True)
+            shared['image'] = _create_or_clean(
+                OpenStackImage(self.admin_os_creds, os_image_settings))
+
+        if not shared['flavor']:
+            shared['flavor'] = _create_or_clean(
+                OpenStackFlavor(
+                    self.admin_os_creds,
+                    FlavorSettings(name=guid + '-flavor-name', ram=ram,
+                                   disk=disk, vcpus=vcpus,
+                                   metadata=self.flavor_metadata)))
+
+        self.image_creator = shared['image']
+        self.flavor_creator = shared['flavor']
+
+        self.__share_image()
+
+    def __share_image(self):
+        """
+        Shares the admin project's image, along with any kernel and ramdisk
+        images, with the project created for this test by __start__()
+        """
+        if (not self.project_creator
+                or self.image_creator.image_settings.exists):
+            return
+
+        project_id = self.project_creator.get_project().id
+        admin_glance = glance_utils.glance_client(self.admin_os_creds)
+        glance = glance_utils.glance_client(self.os_creds)
+
+        for image in (self.image_creator.get_image(),
+                      self.image_creator.get_kernel_image(),
+                      self.image_creator.get_ramdisk_image()):
+            if image:
+                glance_utils.add_image_member(admin_glance, image, project_id)
+                glance_utils.accept_image_member(glance, image, project_id)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Cleans the images and flavors shared by the class' tests
+        """
+        _clean_shared_image_flavors(cls)
+        super(_SharedImageFlavorTestCase, cls).tearDownClass()
+
+
+def _clean_shared_image_flavors(test_class=None):
+    """
+    Cleans the images and flavors created by _init_shared_image_flavor()
+    :param test_class: the _SharedImageFlavorTestCase subclass whose objects
+                       are to be cleaned (cleans those of all classes when
+                       None)
+    """
+    if test_class:
+        test_classes = [test_class]
+    else:
+        test_classes = list(_shared_image_flavors.keys())
+
+    for test_class in test_classes:
+        for shared in _shared_image_flavors.pop(test_class, list()):
+            _clean_creator(shared['flavor'], 'flavor')
+
+            image_creator = shared['image']
+            if image_creator and not image_creator.image_settings.exists:
+                _clean_creator(image_creator, 'image')
+
+
+# Cleans any shared images & flavors left behind when a run is interrupted
+# before tearDownClass() has been called
+atexit.register(_clean_shared_image_flavors)
+
+
+def _create_or_clean(creator):
+    """
+    Calls create() on a creator and cleans any partially created objects when
+    it fails
+    :param creator: the OpenStack creator object
+    :return: the creator
+    """
+    try:
+        creator.create()
+    except Exception:
+        creator.clean()
+        raise
+    return creator
+
+
+def _clean_creator(creator, label):
+    """
+    Cleans a creator when not None, logging rather than raising any exception
+    so the remaining objects of a tearDown() still get cleaned
+    :param creator: the OpenStack creator object to clean
+    :param label: the type of object being cleaned used in the log message
+    """
+    if creator:
+        try:
+            creator.clean()
+        except Exception as e:
+            logger.error(
+                'Unexpected exception cleaning %s with message - %s', label, e)
+
+
+def _clean_creators(creators, label):
+    """
+    Cleans each of the independent creators on its own thread and waits for
+    all of them to complete. Used for objects such as VM instances whose
+    clean() blocks until the object has been deleted
+    :param creators: the OpenStack creator objects to clean
+    :param label: the type of object being cleaned used in the log message
+    """
+    _clean_in_parallel(*[(creator, label) for creator in creators])
+
+
+def _run_in_parallel(target, args_list):
+    """
+    Calls target with each tuple of arguments on its own thread and waits for
+    all of the calls to complete
+    :param target: the function to call
+    :param args_list: the tuples of positional arguments, one per call
+    :return: the list of exceptions raised by the calls that failed
+    """
+    errors = list()
+
+    def run(*args):
+        try:
+            target(*args)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=args) for args in args_list]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return errors
+
+
+def _clean_in_parallel(*creator_labels):
+    """
+    Cleans each of the independent creators on its own thread and waits for
+    all of them to complete
+    :param creator_labels: tuples of the OpenStack creator object to clean
+                           (may be None) and the label used in the log message
+    """
+    _run_in_parallel(_clean_creator, creator_labels)
+
+
+def _create_creators(creators, **create_kwargs):
+    """
+    Calls create() on each of the independent creators on its own thread and
+    waits for all of them to complete
+    :param creators: the OpenStack creator objects to create
+    :param create_kwargs: the keyword arguments passed to each create() call
+                          (e.g. block=True for VM instances)
+    :raise: the first exception raised by any of the create() calls once
+            all of them have been logged
+    """
+    errors = _run_in_parallel(
+        lambda creator: creator.create(**create_kwargs),
+        [(creator,) for creator in creators])
+
+    for error in errors:
+        logger.error('Unexpected exception creating object - %s', error)
+
+    if errors:
+        raise errors[0]
+
+
+def _remove_files(*file_paths):
+    """
+    Removes each file, ignoring those that do not exist, with a single
+    unlink call per file rather than checking for it first
+    :param file_paths: the paths of the files to remove
+    """
+    for file_path in file_paths:
+        try:
+            os.remove(file_path)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+
+
+def _download_files(urls, dest_path):
+    """
+    Downloads each URL into dest_path on its own thread and waits for all of
+    them to complete
+    :param urls: the endpoints of the files to download
+    :param dest_path: the existing directory to save the files
+    :return: the list of file objects in the same order as urls
+    :raise: the first exception raised by any of the downloads
+    """
+    files = [None] * len(urls)
+
+    def download(index):
+        files[index] = file_utils.download(urls[index], dest_path)
+
+    errors = _run_in_parallel(
+        download, [(index,) for index in range(len(urls))])
+
+    if errors:
+        raise errors[0]
+
+    return files
+
+
+class SimpleHealthCheck(_SharedImageFlavorTestCase):
     """
     Test for the CreateInstance class with a single NIC/Port with Floating IPs
     """
@@ -277,17 +476,14 @@ class SimpleHealthCheck(OSIntegrationTestCase):
         and creating an OS image file
         within OpenStack
         """
-        super(self.__class__, self).__start__()
+        super(SimpleHealthCheck, self).__start__()
 
-        self.nova = nova_utils.nova_client(self.os_creds)
-        guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
+        guid = _guid(self.__class__)
         self.vm_inst_name = guid + '-inst'
         self.port_1_name = guid + 'port-1'
 
         # Initialize for tearDown()
-        self.image_creator = None
         self.network_creator = None
-        self.flavor_creator = None
         self.inst_creator = None
 
         self.priv_net_config = openstack_tests.get_priv_net_config(
@@ -296,28 +492,14 @@ class SimpleHealthCheck(OSIntegrationTestCase):
             name=self.port_1_name,
             network_name=self.priv_net_config.network_settings.name)
 
-        # Create Image
-        # Set the default image settings, then set any custom parameters sent
-        # from the app
-        os_image_settings = openstack_tests.cirros_image_settings(
-            name=guid + '-image', image_metadata=self.image_metadata)
-
         try:
-            self.image_creator = OpenStackImage(self.os_creds,
-                                                os_image_settings)
-            self.image_creator.create()
+            # Create Image and Flavor
+            self._init_shared_image_flavor(vcpus=1)
 
             # Create Network
             self.network_creator = OpenStackNetwork(
                 self.os_creds, self.priv_net_config.network_settings)
             self.network_creator.create()
-
-            # Create Flavor
-            self.flavor_creator = OpenStackFlavor(
-                self.admin_os_creds,
-                FlavorSettings(name=guid + '-flavor-name', ram=256, disk=10,
-                               vcpus=1, metadata=self.flavor_metadata))
-            self.flavor_creator.create()
         except Exception as e:
             self.tearDown()
             raise e
@@ -326,39 +508,10 @@ class SimpleHealthCheck(OSIntegrationTestCase):
         """
         Cleans the created object
         """
-        if self.inst_creator:
-            try:
-                self.inst_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning VM instance with message'
-                    ' - %s', e)
-
-        if self.network_creator:
-            try:
-                self.network_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning network with message - %s',
-                    e)
-
-        if self.flavor_creator:
-            try:
-                self.flavor_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning flavor with message - %s',
-                    e)
-
-        if self.image_creator and not self.image_creator.image_settings.exists:
-            try:
-                self.image_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning image with message - %s',
-                    e)
+        _clean_creator(self.inst_creator, 'VM instance')
+        _clean_creator(self.network_creator, 'network')
 
-        super(self.__class__, self).__clean__()
+        super(SimpleHealthCheck, self).__clean__()
 
     def test_check_vm_ip_dhcp(self):
         """
@@ -383,7 +536,7 @@ class SimpleHealthCheck(OSIntegrationTestCase):
         self.assertTrue(check_dhcp_lease(self.inst_creator, ip))
 
 
-class CreateInstanceSimpleTests(OSIntegrationTestCase):
+class CreateInstanceSimpleTests(_SharedImageFlavorTestCase):
     """
     Simple instance creation tests without any other objects
     """
@@ -394,37 +547,22 @@ class CreateInstanceSimpleTests(OSIntegrationTestCase):
         and creating an OS image file
         within OpenStack
         """
-        super(self.__class__, self).__start__()
+        super(CreateInstanceSimpleTests, self).__start__()
 
-        guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
+        guid = _guid(self.__class__)
         self.vm_inst_name = guid + '-inst'
-        self.nova = nova_utils.nova_client(self.os_creds)
-        os_image_settings = openstack_tests.cirros_image_settings(
-            name=guid + '-image', image_metadata=self.image_metadata)
 
         net_config = openstack_tests.get_priv_net_config(
             net_name=guid + '-pub-net', subnet_name=guid + '-pub-subnet',
             router_name=guid + '-pub-router', external_net=self.ext_net_name)
 
         # Initialize for tearDown()
-        self.image_creator = None
-        self.flavor_creator = None
-
         self.network_creator = None
         self.inst_creator = None
 
         try:
-            # Create Image
-            self.image_creator = OpenStackImage(self.os_creds,
-                                                os_image_settings)
-            self.image_creator.create()
-
-            # Create Flavor
-            self.flavor_creator = OpenStackFlavor(
-                self.admin_os_creds,
-                FlavorSettings(name=guid + '-flavor-name', ram=256, disk=10,
-                               vcpus=2, metadata=self.flavor_metadata))
-            self.flavor_creator.create()
+            # Create Image and Flavor
+            self._init_shared_image_flavor()
 
             # Create Network
             self.network_creator = OpenStackNetwork(
@@ -443,38 +581,10 @@ class CreateInstanceSimpleTests(OSIntegrationTestCase):
         """
         Cleans the created object
         """
-        if self.inst_creator:
-            try:
-                self.inst_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning VM instance with message '
-                    '- %s', e)
+        _clean_creator(self.inst_creator, 'VM instance')
+        _clean_creator(self.network_creator, 'network')
 
-        if self.flavor_creator:
-            try:
-                self.flavor_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning flavor with message - %s',
-                    e)
-
-        if self.network_creator:
-            try:
-                self.network_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning network with message - %s',
-                    e)
-
-        if self.image_creator and not self.image_creator.image_settings.exists:
-            try:
-                self.image_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning image with message - %s', e)
-
-        super(self.__class__, self).__clean__()
+        super(CreateInstanceSimpleTests, self).__clean__()
 
     def test_create_delete_instance(self):
         """
@@ -505,7 +615,7 @@ class CreateInstanceSimpleTests(OSIntegrationTestCase):
         self.inst_creator.clean()
 
 
-class CreateInstanceSingleNetworkTests(OSIntegrationTestCase):
+class CreateInstanceSingleNetworkTests(_SharedImageFlavorTestCase):
     """
     Test for the CreateInstance class with a single NIC/Port with Floating IPs
     """
@@ -515,10 +625,9 @@ class CreateInstanceSingleNetworkTests(OSIntegrationTestCase):
         Instantiates the CreateImage object that is responsible for downloading
         and creating an OS image file within OpenStack
         """
-        super(self.__class__, self).__start__()
+        super(CreateInstanceSingleNetworkTests, self).__start__()
 
-        self.nova = nova_utils.nova_client(self.os_creds)
-        guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
+        guid = _guid(self.__class__)
         self.keypair_priv_filepath = 'tmp/' + guid
         self.keypair_pub_filepath = self.keypair_priv_filepath + '.pub'
         self.keypair_name = guid + '-kp'
@@ -528,10 +637,8 @@ class CreateInstanceSingleNetworkTests(OSIntegrationTestCase):
         self.floating_ip_name = guid + 'fip1'
 
         # Initialize for tearDown()
-        self.image_creator = None
         self.network_creator = None
         self.router_creator = None
-        self.flavor_creator = None
         self.keypair_creator = None
         self.sec_grp_creator = None
         self.inst_creators = list()
@@ -539,13 +646,9 @@ class CreateInstanceSingleNetworkTests(OSIntegrationTestCase):
         self.pub_net_config = openstack_tests.get_pub_net_config(
             net_name=guid + '-pub-net', subnet_name=guid + '-pub-subnet',
             router_name=guid + '-pub-router', external_net=self.ext_net_name)
-        os_image_settings = openstack_tests.cirros_image_settings(
-            name=guid + '-image', image_metadata=self.image_metadata)
         try:
-            # Create Image
-            self.image_creator = OpenStackImage(self.os_creds,
-                                                os_image_settings)
-            self.image_creator.create()
+            # Create Image and Flavor
+            self._init_shared_image_flavor()
 
             # Create Network
             self.network_creator = OpenStackNetwork(
@@ -557,13 +660,6 @@ class CreateInstanceSingleNetworkTests(OSIntegrationTestCase):
                 self.os_creds, self.pub_net_config.router_settings)
             self.router_creator.create()
 
-            # Create Flavor
-            self.flavor_creator = OpenStackFlavor(
-                self.admin_os_creds,
-                FlavorSettings(name=guid + '-flavor-name', ram=256, disk=10,
-                               vcpus=2, metadata=self.flavor_metadata))
-            self.flavor_creator.create()
-
             self.keypair_creator = OpenStackKeypair(
                 self.os_creds, KeypairSettings(
                     name=self.keypair_name,
@@ -593,68 +689,17 @@ class CreateInstanceSingleNetworkTests(OSIntegrationTestCase):
         """
         Cleans the created object
         """
-        for inst_creator in self.inst_creators:
-            try:
-                inst_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning VM instance with message '
-                    '- %s', e)
-
-        if self.keypair_creator:
-            try:
-                self.keypair_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning keypair with message - %s',
-                    e)
-
-        if os.path.isfile(self.keypair_pub_filepath):
-            os.remove(self.keypair_pub_filepath)
-
-        if os.path.isfile(self.keypair_priv_filepath):
-            os.remove(self.keypair_priv_filepath)
-
-        if self.flavor_creator:
-            try:
-                self.flavor_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning flavor with message - %s',
-                    e)
+        _clean_creators(self.inst_creators, 'VM instance')
 
-        if self.sec_grp_creator:
-            try:
-                self.sec_grp_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning security group with message'
-                    ' - %s', e)
+        _clean_creator(self.keypair_creator, 'keypair')
 
-        if self.router_creator:
-            try:
-                self.router_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning router with message - %s',
-                    e)
+        _remove_files(self.keypair_pub_filepath, self.keypair_priv_filepath)
 
-        if self.network_creator:
-            try:
-                self.network_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning network with message - %s',
-                    e)
+        _clean_creator(self.sec_grp_creator, 'security group')
+        _clean_creator(self.router_creator, 'router')
+        _clean_creator(self.network_creator, 'network')
 
-        if self.image_creator and not self.image_creator.image_settings.exists:
-            try:
-                self.image_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning image with message - %s', e)
-
-        super(self.__class__, self).__clean__()
+        super(CreateInstanceSingleNetworkTests, self).__clean__()
 
     def test_single_port_static(self):
         """
@@ -688,10 +733,13 @@ class CreateInstanceSingleNetworkTests(OSIntegrationTestCase):
         self.assertTrue(inst_creator.vm_active(block=True))
         self.assertEqual(vm_inst.id, inst_creator.get_vm_inst().id)
 
-    def test_ssh_client_fip_before_active(self):
+    def _create_fip_instance(self, block):
         """
-        Tests the ability to access a VM via SSH and a floating IP when it has
-        been assigned prior to being active.
+        Creates a VM instance with a floating IP, validates its DHCP lease,
+        adds the security group allowing SSH and validates the SSH client
+        :param block: passed to OpenStackVmInstance#create(), when False the
+                      floating IP is assigned before the VM is active
+        :return: the tuple (instance_settings, inst_creator)
         """
         port_settings = PortSettings(
             name=self.port_1_name,
@@ -710,10 +758,15 @@ class CreateInstanceSingleNetworkTests(OSIntegrationTestCase):
             self.image_creator.image_settings,
             keypair_settings=self.keypair_creator.keypair_settings)
         self.inst_creators.append(inst_creator)
-        vm_inst = inst_creator.create()
+
+        # block=True will force the create() method to block until the VM is
+        # active and the floating IP is assigned afterwards
+        vm_inst = inst_creator.create(block=block)
         self.assertIsNotNone(vm_inst)
 
-        self.assertTrue(inst_creator.vm_active(block=True))
+        # create(block=True) raises when the VM does not become active
+        if not block:
+            self.assertTrue(inst_creator.vm_active(block=True))
 
         ip = inst_creator.get_port_ip(port_settings.name)
         self.assertTrue(check_dhcp_lease(inst_creator, ip))
@@ -723,82 +776,29 @@ class CreateInstanceSingleNetworkTests(OSIntegrationTestCase):
         self.assertEqual(vm_inst.id, inst_creator.get_vm_inst().id)
 
         self.assertTrue(validate_ssh_client(inst_creator))
+        return instance_settings, inst_creator
 
-    def test_ssh_client_fip_after_active(self):
+    def test_ssh_client_fip_before_active(self):
         """
         Tests the ability to access a VM via SSH and a floating IP when it has
         been assigned prior to being active.
         """
-        port_settings = PortSettings(
-            name=self.port_1_name,
-            network_name=self.pub_net_config.network_settings.name)
-
-        instance_settings = VmInstanceSettings(
-            name=self.vm_inst_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            port_settings=[port_settings],
-            floating_ip_settings=[FloatingIpSettings(
-                name=self.floating_ip_name, port_name=self.port_1_name,
-                router_name=self.pub_net_config.router_settings.name)])
+        self._create_fip_instance(block=False)
 
-        inst_creator = OpenStackVmInstance(
-            self.os_creds, instance_settings,
-            self.image_creator.image_settings,
-            keypair_settings=self.keypair_creator.keypair_settings)
-        self.inst_creators.append(inst_creator)
-
-        # block=True will force the create() method to block until the
-        vm_inst = inst_creator.create(block=True)
-        self.assertIsNotNone(vm_inst)
-
-        self.assertTrue(inst_creator.vm_active(block=True))
-
-        ip = inst_creator.get_port_ip(port_settings.name)
-        self.assertTrue(check_dhcp_lease(inst_creator, ip))
-
-        inst_creator.add_security_group(
-            self.sec_grp_creator.get_security_group())
-        self.assertEqual(vm_inst.id, inst_creator.get_vm_inst().id)
-
-        self.assertTrue(validate_ssh_client(inst_creator))
+    def test_ssh_client_fip_after_active(self):
+        """
+        Tests the ability to access a VM via SSH and a floating IP when it has
+        been assigned after being active.
+        """
+        self._create_fip_instance(block=True)
 
     def test_ssh_client_fip_second_creator(self):
         """
         Tests the ability to access a VM via SSH and a floating IP via a
         creator that is identical to the original creator.
         """
-        port_settings = PortSettings(
-            name=self.port_1_name,
-            network_name=self.pub_net_config.network_settings.name)
-
-        instance_settings = VmInstanceSettings(
-            name=self.vm_inst_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            port_settings=[port_settings],
-            floating_ip_settings=[FloatingIpSettings(
-                name=self.floating_ip_name, port_name=self.port_1_name,
-                router_name=self.pub_net_config.router_settings.name)])
-
-        inst_creator = OpenStackVmInstance(
-            self.os_creds, instance_settings,
-            self.image_creator.image_settings,
-            keypair_settings=self.keypair_creator.keypair_settings)
-        self.inst_creators.append(inst_creator)
-
-        # block=True will force the create() method to block until the
-        vm_inst = inst_creator.create(block=True)
-        self.assertIsNotNone(vm_inst)
-
-        self.assertTrue(inst_creator.vm_active(block=True))
-
-        ip = inst_creator.get_port_ip(port_settings.name)
-        self.assertTrue(check_dhcp_lease(inst_creator, ip))
-
-        inst_creator.add_security_group(
-            self.sec_grp_creator.get_security_group())
-        self.assertEqual(vm_inst.id, inst_creator.get_vm_inst().id)
-
-        self.assertTrue(validate_ssh_client(inst_creator))
+        instance_settings, inst_creator = self._create_fip_instance(
+            block=True)
 
         inst_creator2 = OpenStackVmInstance(
             self.os_creds, instance_settings,
@@ -808,7 +808,7 @@ class CreateInstanceSingleNetworkTests(OSIntegrationTestCase):
         self.assertTrue(validate_ssh_client(inst_creator2))
 
 
-class CreateInstancePortManipulationTests(OSIntegrationTestCase):
+class CreateInstancePortManipulationTests(_SharedImageFlavorTestCase):
     """
     Test for the CreateInstance class with a single NIC/Port where mac and IP
     values are manually set
@@ -819,43 +819,30 @@ class CreateInstancePortManipulationTests(OSIntegrationTestCase):
         Instantiates the CreateImage object that is responsible for downloading
         and creating an OS image file within OpenStack
         """
-        super(self.__class__, self).__start__()
+        super(CreateInstancePortManipulationTests, self).__start__()
 
-        guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
+        guid = _guid(self.__class__)
         self.vm_inst_name = guid + '-inst'
         self.port_1_name = guid + 'port-1'
         self.port_2_name = guid + 'port-2'
         self.floating_ip_name = guid + 'fip1'
 
         # Initialize for tearDown()
-        self.image_creator = None
         self.network_creator = None
-        self.flavor_creator = None
         self.inst_creator = None
 
         self.net_config = openstack_tests.get_priv_net_config(
             net_name=guid + '-pub-net', subnet_name=guid + '-pub-subnet',
             router_name=guid + '-pub-router', external_net=self.ext_net_name)
-        os_image_settings = openstack_tests.cirros_image_settings(
-            name=guid + '-image', image_metadata=self.image_metadata)
 
         try:
-            # Create Image
-            self.image_creator = OpenStackImage(self.os_creds,
-                                                os_image_settings)
-            self.image_creator.create()
+            # Create Image and Flavor
+            self._init_shared_image_flavor()
 
             # Create Network
             self.network_creator = OpenStackNetwork(
                 self.os_creds, self.net_config.network_settings)
             self.network_creator.create()
-
-            # Create Flavor
-            self.flavor_creator = OpenStackFlavor(
-                self.admin_os_creds,
-                FlavorSettings(name=guid + '-flavor-name', ram=256, disk=10,
-                               vcpus=2, metadata=self.flavor_metadata))
-            self.flavor_creator.create()
         except Exception as e:
             self.tearDown()
             raise e
@@ -864,38 +851,36 @@ class CreateInstancePortManipulationTests(OSIntegrationTestCase):
         """
         Cleans the created object
         """
-        if self.inst_creator:
-            try:
-                self.inst_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning VM instance with message '
-                    '- %s', e)
+        _clean_creator(self.inst_creator, 'VM instance')
+        _clean_creator(self.network_creator, 'network')
 
-        if self.flavor_creator:
-            try:
-                self.flavor_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning flavor with message - %s',
-                    e)
+        super(CreateInstancePortManipulationTests, self).__clean__()
 
-        if self.network_creator:
-            try:
-                self.network_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning network with message - %s',
-                    e)
+    def _init_inst_creator(self, port_settings):
+        """
+        Sets self.inst_creator to a VM instance creator with a single port
+        configured with port_settings
+        :param port_settings: the PortSettings object
+        """
+        instance_settings = VmInstanceSettings(
+            name=self.vm_inst_name,
+            flavor=self.flavor_creator.flavor_settings.name,
+            port_settings=[port_settings])
 
-        if self.image_creator and not self.image_creator.image_settings.exists:
-            try:
-                self.image_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning image with message - %s', e)
+        self.inst_creator = OpenStackVmInstance(
+            self.os_creds, instance_settings,
+            self.image_creator.image_settings)
 
-        super(self.__class__, self).__clean__()
+    def _assert_create_fails(self, port_settings, exception=Exception):
+        """
+        Asserts that creating a VM instance with a single port configured with
+        port_settings raises an exception
+        :param port_settings: the PortSettings object with invalid values
+        :param exception: the expected exception type
+        """
+        self._init_inst_creator(port_settings)
+        with self.assertRaises(exception):
+            self.inst_creator.create()
 
     def test_set_custom_valid_ip_one_subnet(self):
         """
@@ -909,20 +894,11 @@ class CreateInstancePortManipulationTests(OSIntegrationTestCase):
             network_name=self.net_config.network_settings.name,
             ip_addrs=[{'subnet_name': sub_settings[0].name, 'ip': ip}])
 
-        instance_settings = VmInstanceSettings(
-            name=self.vm_inst_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            port_settings=[port_settings])
-
-        self.inst_creator = OpenStackVmInstance(
-            self.os_creds, instance_settings,
-            self.image_creator.image_settings)
+        self._init_inst_creator(port_settings)
         self.inst_creator.create(block=True)
 
         self.assertEqual(ip, self.inst_creator.get_port_ip(
-            self.port_1_name,
-            subnet_name=self.net_config.network_settings.subnet_settings[
-                0].name))
+            self.port_1_name, subnet_name=sub_settings[0].name))
 
     def test_set_custom_invalid_ip_one_subnet(self):
         """
@@ -936,17 +912,7 @@ class CreateInstancePortManipulationTests(OSIntegrationTestCase):
             network_name=self.net_config.network_settings.name,
             ip_addrs=[{'subnet_name': sub_settings[0].name, 'ip': ip}])
 
-        instance_settings = VmInstanceSettings(
-            name=self.vm_inst_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            port_settings=[port_settings])
-
-        self.inst_creator = OpenStackVmInstance(
-            self.os_creds, instance_settings,
-            self.image_creator.image_settings)
-
-        with self.assertRaises(InvalidIpForSubnetClient):
-            self.inst_creator.create()
+        self._assert_create_fails(port_settings, InvalidIpForSubnetClient)
 
     def test_set_custom_valid_mac(self):
         """
@@ -959,14 +925,7 @@ class CreateInstancePortManipulationTests(OSIntegrationTestCase):
             network_name=self.net_config.network_settings.name,
             mac_address=mac_addr)
 
-        instance_settings = VmInstanceSettings(
-            name=self.vm_inst_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            port_settings=[port_settings])
-
-        self.inst_creator = OpenStackVmInstance(
-            self.os_creds, instance_settings,
-            self.image_creator.image_settings)
+        self._init_inst_creator(port_settings)
         self.inst_creator.create(block=True)
 
         self.assertEqual(mac_addr,
@@ -983,17 +942,7 @@ class CreateInstancePortManipulationTests(OSIntegrationTestCase):
             network_name=self.net_config.network_settings.name,
             mac_address='foo')
 
-        instance_settings = VmInstanceSettings(
-            name=self.vm_inst_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            port_settings=[port_settings])
-
-        self.inst_creator = OpenStackVmInstance(
-            self.os_creds, instance_settings,
-            self.image_creator.image_settings)
-
-        with self.assertRaises(Exception):
-            self.inst_creator.create()
+        self._assert_create_fails(port_settings)
 
     def test_set_custom_mac_and_ip(self):
         """
@@ -1009,20 +958,11 @@ class CreateInstancePortManipulationTests(OSIntegrationTestCase):
             mac_address=mac_addr,
             ip_addrs=[{'subnet_name': sub_settings[0].name, 'ip': ip}])
 
-        instance_settings = VmInstanceSettings(
-            name=self.vm_inst_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            port_settings=[port_settings])
-
-        self.inst_creator = OpenStackVmInstance(
-            self.os_creds, instance_settings,
-            self.image_creator.image_settings)
+        self._init_inst_creator(port_settings)
         self.inst_creator.create(block=True)
 
         self.assertEqual(ip, self.inst_creator.get_port_ip(
-            self.port_1_name,
-            subnet_name=self.net_config.network_settings.subnet_settings[
-                0].name))
+            self.port_1_name, subnet_name=sub_settings[0].name))
         self.assertEqual(mac_addr,
                          self.inst_creator.get_port_mac(self.port_1_name))
 
@@ -1034,19 +974,12 @@ class CreateInstancePortManipulationTests(OSIntegrationTestCase):
         ip = '10.55.0.101'
         mac_addr = '0a:1b:2c:3d:4e:5f'
         pair = {'ip_address': ip, 'mac_address': mac_addr}
-        port_settings = PortSettings(
-            name=self.port_1_name,
-            network_name=self.net_config.network_settings.name,
-            allowed_address_pairs=[pair])
-
-        instance_settings = VmInstanceSettings(
-            name=self.vm_inst_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            port_settings=[port_settings])
+        port_settings = PortSettings(
+            name=self.port_1_name,
+            network_name=self.net_config.network_settings.name,
+            allowed_address_pairs=[pair])
 
-        self.inst_creator = OpenStackVmInstance(
-            self.os_creds, instance_settings,
-            self.image_creator.image_settings)
+        self._init_inst_creator(port_settings)
         self.inst_creator.create(block=True)
 
         port = self.inst_creator.get_port_by_name(port_settings.name)
@@ -1064,23 +997,12 @@ class CreateInstancePortManipulationTests(OSIntegrationTestCase):
         ip = '10.55.0.101'
         mac_addr = 'foo'
         pair = {'ip_address': ip, 'mac_address': mac_addr}
-        pairs = set()
-        pairs.add((ip, mac_addr))
         port_settings = PortSettings(
             name=self.port_1_name,
             network_name=self.net_config.network_settings.name,
             allowed_address_pairs=[pair])
 
-        instance_settings = VmInstanceSettings(
-            name=self.vm_inst_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            port_settings=[port_settings])
-
-        self.inst_creator = OpenStackVmInstance(
-            self.os_creds, instance_settings,
-            self.image_creator.image_settings)
-        with self.assertRaises(Exception):
-            self.inst_creator.create()
+        self._assert_create_fails(port_settings)
 
     def test_set_allowed_address_pairs_bad_ip(self):
         """
@@ -1090,23 +1012,12 @@ class CreateInstancePortManipulationTests(OSIntegrationTestCase):
         ip = 'foo'
         mac_addr = '0a:1b:2c:3d:4e:5f'
         pair = {'ip_address': ip, 'mac_address': mac_addr}
-        pairs = set()
-        pairs.add((ip, mac_addr))
         port_settings = PortSettings(
             name=self.port_1_name,
             network_name=self.net_config.network_settings.name,
             allowed_address_pairs=[pair])
 
-        instance_settings = VmInstanceSettings(
-            name=self.vm_inst_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            port_settings=[port_settings])
-
-        self.inst_creator = OpenStackVmInstance(
-            self.os_creds, instance_settings,
-            self.image_creator.image_settings)
-        with self.assertRaises(Exception):
-            self.inst_creator.create()
+        self._assert_create_fails(port_settings)
 
 
 class CreateInstanceOnComputeHost(OSIntegrationTestCase):
@@ -1119,9 +1030,9 @@ class CreateInstanceOnComputeHost(OSIntegrationTestCase):
         Instantiates the CreateImage object that is responsible for downloading
         and creating an OS image file within OpenStack
         """
-        super(self.__class__, self).__start__()
+        super(CreateInstanceOnComputeHost, self).__start__()
 
-        guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
+        guid = _guid(self.__class__)
         self.vm_inst_name = guid + '-inst'
         self.port_base_name = guid + 'port'
 
@@ -1135,7 +1046,8 @@ class CreateInstanceOnComputeHost(OSIntegrationTestCase):
             net_name=guid + '-priv-net', subnet_name=guid + '-priv-subnet')
 
         os_image_settings = openstack_tests.cirros_image_settings(
-            name=guid + '-image', image_metadata=self.image_metadata)
+            name=guid + '-image', image_metadata=self.image_metadata,
+            use_local_file=True)
 
         try:
             # Create Network
@@ -1163,46 +1075,21 @@ class CreateInstanceOnComputeHost(OSIntegrationTestCase):
         """
         Cleans the created object
         """
-        for inst_creator in self.inst_creators:
-            try:
-                inst_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning VM instance with message '
-                    '- %s', e)
-
-        if self.flavor_creator:
-            try:
-                self.flavor_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning flavor with message - %s',
-                    e)
+        _clean_creators(self.inst_creators, 'VM instance')
 
-        if self.network_creator:
-            try:
-                self.network_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning network with message - %s',
-                    e)
+        _clean_creator(self.flavor_creator, 'flavor')
+        _clean_creator(self.network_creator, 'network')
 
         if self.image_creator and not self.image_creator.image_settings.exists:
-            try:
-                self.image_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning image with message - %s', e)
+            _clean_creator(self.image_creator, 'image')
 
-        super(self.__class__, self).__clean__()
+        super(CreateInstanceOnComputeHost, self).__clean__()
 
     def test_deploy_vm_to_each_compute_node(self):
         """
         Tests the creation of OpenStack VM instances to each compute node.
         """
-        from snaps.openstack.utils import nova_utils
-        nova = nova_utils.nova_client(self.admin_os_creds)
-        zone_hosts = nova_utils.get_availability_zone_hosts(nova)
+        zone_hosts = nova_utils.get_availability_zone_hosts(self.admin_nova)
 
         # Create Instance on each server/zone
         ctr = 0
@@ -1249,9 +1136,7 @@ class CreateInstancePubPrivNetTests(OSIntegrationTestCase):
         Instantiates the CreateImage object that is responsible for downloading
         and creating an OS image file within OpenStack
         """
-        super(self.__class__, self).__start__()
-
-        self.nova = nova_utils.nova_client(self.os_creds)
+        super(CreateInstancePubPrivNetTests, self).__start__()
 
         # Initialize for tearDown()
         self.image_creator = None
@@ -1262,7 +1147,7 @@ class CreateInstancePubPrivNetTests(OSIntegrationTestCase):
         self.sec_grp_creator = None
         self.inst_creator = None
 
-        self.guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
+        self.guid = _guid(self.__class__)
         self.keypair_priv_filepath = 'tmp/' + self.guid
         self.keypair_pub_filepath = self.keypair_priv_filepath + '.pub'
         self.keypair_name = self.guid + '-kp'
@@ -1281,9 +1166,8 @@ class CreateInstancePubPrivNetTests(OSIntegrationTestCase):
             router_name=self.guid + '-pub-router',
             external_net=self.ext_net_name)
 
-        image_name = self.__class__.__name__ + '-' + str(uuid.uuid4())
         os_image_settings = openstack_tests.centos_image_settings(
-            name=image_name, image_metadata=self.image_metadata)
+            name=self.guid + '-image', image_metadata=self.image_metadata)
 
         try:
             # Create Image
@@ -1297,17 +1181,15 @@ class CreateInstancePubPrivNetTests(OSIntegrationTestCase):
             # Second network is private
             self.network_creators.append(OpenStackNetwork(
                 self.os_creds, self.priv_net_config.network_settings))
-            for network_creator in self.network_creators:
-                network_creator.create()
+            _create_creators(self.network_creators)
 
             self.router_creators.append(OpenStackRouter(
                 self.os_creds, self.pub_net_config.router_settings))
             self.router_creators.append(OpenStackRouter(
                 self.os_creds, self.priv_net_config.router_settings))
 
-            # Create Routers
-            for router_creator in self.router_creators:
-                router_creator.create()
+            # Create Routers once both networks exist
+            _create_creators(self.router_creators)
 
             # Create Flavor
             self.flavor_creator = OpenStackFlavor(
@@ -1347,68 +1229,24 @@ class CreateInstancePubPrivNetTests(OSIntegrationTestCase):
         """
         Cleans the created objects
         """
-        if self.inst_creator:
-            try:
-                self.inst_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning VM instance with message '
-                    '- %s', e)
-
-        if self.keypair_creator:
-            try:
-                self.keypair_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning keypair with message - %s',
-                    e)
-
-        if os.path.isfile(self.keypair_pub_filepath):
-            os.remove(self.keypair_pub_filepath)
+        _clean_creator(self.inst_creator, 'VM instance')
+        _clean_creator(self.keypair_creator, 'keypair')
 
-        if os.path.isfile(self.keypair_priv_filepath):
-            os.remove(self.keypair_priv_filepath)
+        _remove_files(self.keypair_pub_filepath, self.keypair_priv_filepath)
 
-        if self.flavor_creator:
-            try:
-                self.flavor_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning flavor with message - %s',
-                    e)
-
-        for router_creator in self.router_creators:
-            try:
-                router_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning router with message - %s',
-                    e)
+        _clean_creator(self.flavor_creator, 'flavor')
 
-        for network_creator in self.network_creators:
-            try:
-                network_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning network with message - %s',
-                    e)
+        # The routers are independent as are the networks once the routers
+        # that reference them have been removed
+        _clean_creators(self.router_creators, 'router')
+        _clean_creators(self.network_creators, 'network')
 
-        if self.sec_grp_creator:
-            try:
-                self.sec_grp_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning security group with message'
-                    ' - %s', e)
+        _clean_creator(self.sec_grp_creator, 'security group')
 
         if self.image_creator and not self.image_creator.image_settings.exists:
-            try:
-                self.image_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning image with message - %s', e)
+            _clean_creator(self.image_creator, 'image')
 
-        super(self.__class__, self).__clean__()
+        super(CreateInstancePubPrivNetTests, self).__clean__()
 
     def test_dual_ports_dhcp(self):
         """
@@ -1446,13 +1284,11 @@ class CreateInstancePubPrivNetTests(OSIntegrationTestCase):
             self.image_creator.image_settings,
             keypair_settings=self.keypair_creator.keypair_settings)
 
+        # Blocks until the VM has been properly activated
         vm_inst = self.inst_creator.create(block=True)
 
         self.assertEqual(vm_inst.id, self.inst_creator.get_vm_inst().id)
 
-        # Effectively blocks until VM has been properly activated
-        self.assertTrue(self.inst_creator.vm_active(block=True))
-
         ip = self.inst_creator.get_port_ip(ports_settings[0].name)
         self.assertTrue(check_dhcp_lease(self.inst_creator, ip))
 
@@ -1466,7 +1302,7 @@ class CreateInstancePubPrivNetTests(OSIntegrationTestCase):
         self.assertEqual(0, self.inst_creator.config_nics())
 
 
-class InstanceSecurityGroupTests(OSIntegrationTestCase):
+class InstanceSecurityGroupTests(_SharedImageFlavorTestCase):
     """
     Tests that include, add, and remove security groups from VM instances
     """
@@ -1476,13 +1312,9 @@ class InstanceSecurityGroupTests(OSIntegrationTestCase):
         Instantiates the CreateImage object that is responsible for downloading
         and creating an OS image file within OpenStack
         """
-        super(self.__class__, self).__start__()
+        super(InstanceSecurityGroupTests, self).__start__()
 
-        self.guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
-        self.vm_inst_name = self.guid + '-inst'
-        self.nova = nova_utils.nova_client(self.os_creds)
-        os_image_settings = openstack_tests.cirros_image_settings(
-            name=self.guid + '-image', image_metadata=self.image_metadata)
+        self.guid = _guid(self.__class__)
 
         self.vm_inst_name = self.guid + '-inst'
         self.port_1_name = self.guid + 'port-1'
@@ -1496,32 +1328,20 @@ class InstanceSecurityGroupTests(OSIntegrationTestCase):
             external_net=self.ext_net_name)
 
         # Initialize for tearDown()
-        self.image_creator = None
-        self.flavor_creator = None
         self.network_creator = None
         self.router_creator = None
         self.inst_creator = None
         self.sec_grp_creators = list()
 
         try:
-            # Create Image
-            self.image_creator = OpenStackImage(self.os_creds,
-                                                os_image_settings)
-            self.image_creator.create()
+            # Create Image and Flavor
+            self._init_shared_image_flavor()
 
             # Create Network
             self.network_creator = OpenStackNetwork(
                 self.os_creds, net_config.network_settings)
             self.network_creator.create()
 
-            # Create Flavor
-            self.flavor_creator = OpenStackFlavor(
-                self.admin_os_creds,
-                FlavorSettings(name=self.guid + '-flavor-name', ram=256,
-                               disk=10, vcpus=2,
-                               metadata=self.flavor_metadata))
-            self.flavor_creator.create()
-
             self.port_settings = PortSettings(
                 name=self.guid + '-port',
                 network_name=net_config.network_settings.name)
@@ -1533,46 +1353,15 @@ class InstanceSecurityGroupTests(OSIntegrationTestCase):
         """
         Cleans the created object
         """
-        if self.inst_creator:
-            try:
-                self.inst_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning VM instance with message -'
-                    ' %s', e)
-
-        for sec_grp_creator in self.sec_grp_creators:
-            try:
-                sec_grp_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning security group with message'
-                    ' - %s', e)
-
-        if self.flavor_creator:
-            try:
-                self.flavor_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning flavor with message - %s',
-                    e)
-
-        if self.network_creator:
-            try:
-                self.network_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning network with message - %s',
-                    e)
+        # The instance's port must be gone before its groups can be deleted
+        _clean_creator(self.inst_creator, 'VM instance')
 
-        if self.image_creator and not self.image_creator.image_settings.exists:
-            try:
-                self.image_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning image with message - %s', e)
+        _clean_in_parallel(
+            (self.network_creator, 'network'),
+            *[(sec_grp_creator, 'security group')
+              for sec_grp_creator in self.sec_grp_creators])
 
-        super(self.__class__, self).__clean__()
+        super(InstanceSecurityGroupTests, self).__clean__()
 
     def test_add_security_group(self):
         """
@@ -1599,14 +1388,14 @@ class InstanceSecurityGroupTests(OSIntegrationTestCase):
 
         # Check that group has not been added
         self.assertFalse(inst_has_sec_grp(
-            self.nova, self.inst_creator.get_vm_inst(), sec_grp_settings.name))
+            self.nova, vm_inst, sec_grp_settings.name))
 
         # Add security group to instance after activated
         self.inst_creator.add_security_group(sec_grp)
 
         # Validate that security group has been added
         self.assertTrue(inst_has_sec_grp(
-            self.nova, self.inst_creator.get_vm_inst(), sec_grp_settings.name))
+            self.nova, vm_inst, sec_grp_settings.name))
 
     def test_add_invalid_security_group(self):
         """
@@ -1634,14 +1423,14 @@ class InstanceSecurityGroupTests(OSIntegrationTestCase):
 
         # Check that group has not been added
         self.assertFalse(inst_has_sec_grp(
-            self.nova, self.inst_creator.get_vm_inst(), sec_grp_settings.name))
+            self.nova, vm_inst, sec_grp_settings.name))
 
         # Add security group to instance after activated
         self.assertFalse(self.inst_creator.add_security_group(sec_grp))
 
         # Validate that security group has been added
         self.assertFalse(inst_has_sec_grp(
-            self.nova, self.inst_creator.get_vm_inst(), sec_grp_settings.name))
+            self.nova, vm_inst, sec_grp_settings.name))
 
     def test_remove_security_group(self):
         """
@@ -1677,7 +1466,7 @@ class InstanceSecurityGroupTests(OSIntegrationTestCase):
 
         # Validate that security group has been added
         self.assertFalse(inst_has_sec_grp(
-            self.nova, self.inst_creator.get_vm_inst(), sec_grp_settings.name))
+            self.nova, vm_inst, sec_grp_settings.name))
 
     def test_remove_security_group_never_added(self):
         """
@@ -1705,14 +1494,14 @@ class InstanceSecurityGroupTests(OSIntegrationTestCase):
 
         # Check that group has been added
         self.assertFalse(inst_has_sec_grp(
-            self.nova, self.inst_creator.get_vm_inst(), sec_grp_settings.name))
+            self.nova, vm_inst, sec_grp_settings.name))
 
         # Add security group to instance after activated
         self.assertFalse(self.inst_creator.remove_security_group(sec_grp))
 
         # Validate that security group has been added
         self.assertFalse(inst_has_sec_grp(
-            self.nova, self.inst_creator.get_vm_inst(), sec_grp_settings.name))
+            self.nova, vm_inst, sec_grp_settings.name))
 
     def test_add_same_security_group(self):
         """
@@ -1741,14 +1530,14 @@ class InstanceSecurityGroupTests(OSIntegrationTestCase):
 
         # Check that group has been added
         self.assertTrue(inst_has_sec_grp(
-            self.nova, self.inst_creator.get_vm_inst(), sec_grp_settings.name))
+            self.nova, vm_inst, sec_grp_settings.name))
 
         # Add security group to instance after activated
         self.assertTrue(self.inst_creator.add_security_group(sec_grp))
 
         # Validate that security group has been added
         self.assertTrue(inst_has_sec_grp(
-            self.nova, self.inst_creator.get_vm_inst(), sec_grp_settings.name))
+            self.nova, vm_inst, sec_grp_settings.name))
 
 
 def inst_has_sec_grp(nova, vm_inst, sec_grp_name):
@@ -1760,10 +1549,7 @@ def inst_has_sec_grp(nova, vm_inst, sec_grp_name):
     :return: T/F
     """
     sec_grp_names = nova_utils.get_server_security_group_names(nova, vm_inst)
-    for name in sec_grp_names:
-        if sec_grp_name == name:
-            return True
-    return False
+    return sec_grp_name in sec_grp_names
 
 
 def validate_ssh_client(instance_creator):
@@ -1804,12 +1590,11 @@ class CreateInstanceFromThreePartImage(OSIntegrationTestCase):
         Instantiates the CreateImage object that is responsible for downloading
         and creating an OS image file within OpenStack
         """
-        super(self.__class__, self).__start__()
+        super(CreateInstanceFromThreePartImage, self).__start__()
 
-        guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
+        guid = _guid(self.__class__)
         self.image_name = guid
         self.vm_inst_name = guid + '-inst'
-        self.nova = nova_utils.nova_client(self.os_creds)
 
         net_config = openstack_tests.get_priv_net_config(
             net_name=guid + '-pub-net', subnet_name=guid + '-pub-subnet',
@@ -1846,19 +1631,16 @@ class CreateInstanceFromThreePartImage(OSIntegrationTestCase):
                     'overridden this functionality')
 
             self.image_creator = OpenStackImage(self.os_creds, image_settings)
-            self.image_creator.create()
-
-            # Create Flavor
             self.flavor_creator = OpenStackFlavor(
                 self.admin_os_creds,
                 FlavorSettings(name=guid + '-flavor-name', ram=256, disk=10,
                                vcpus=2, metadata=self.flavor_metadata))
-            self.flavor_creator.create()
-
-            # Create Network
             self.network_creator = OpenStackNetwork(
                 self.os_creds, net_config.network_settings)
-            self.network_creator.create()
+
+            # Create the Image, Flavor and Network concurrently
+            _create_creators([self.image_creator, self.flavor_creator,
+                              self.network_creator])
 
             self.port_settings = PortSettings(
                 name=guid + '-port',
@@ -1871,38 +1653,17 @@ class CreateInstanceFromThreePartImage(OSIntegrationTestCase):
         """
         Cleans the created object
         """
-        if self.inst_creator:
-            try:
-                self.inst_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning VM instance with message -'
-                    ' %s', e)
-
-        if self.flavor_creator:
-            try:
-                self.flavor_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning flavor with message - %s',
-                    e)
-
-        if self.network_creator:
-            try:
-                self.network_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning network with message - %s',
-                    e)
+        _clean_creator(self.inst_creator, 'VM instance')
 
+        image_creator = None
         if self.image_creator and not self.image_creator.image_settings.exists:
-            try:
-                self.image_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning image with message - %s', e)
+            image_creator = self.image_creator
 
-        super(self.__class__, self).__clean__()
+        _clean_in_parallel((self.flavor_creator, 'flavor'),
+                           (self.network_creator, 'network'),
+                           (image_creator, 'image'))
+
+        super(CreateInstanceFromThreePartImage, self).__clean__()
 
     def test_create_instance_from_three_part_image(self):
         """
@@ -1930,17 +1691,93 @@ class CreateInstanceMockOfflineTests(OSComponentTestCase):
     images differently than the default behavior of the existing tests
     primarily for offline testing
     """
+    # The credentials used by setUpClass(), set by parameterize()
+    class_os_creds = None
+
+    @staticmethod
+    def parameterize(testcase_klass, os_creds, ext_net_name,
+                     image_metadata=None, log_level=logging.DEBUG):
+        """
+        Create a suite containing all tests taken from a new subclass of the
+        given class holding os_creds as a class attribute so setUpClass() can
+        create the objects shared by its tests. Each call creates its own
+        subclass so suites with different parameters never share them.
+        """
+        klass = type(testcase_klass.__name__, (testcase_klass,),
+                     {'__module__': testcase_klass.__module__,
+                      'class_os_creds': os_creds})
+        return OSComponentTestCase.parameterize(
+            klass, os_creds, ext_net_name, image_metadata=image_metadata,
+            log_level=log_level)
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Downloads the Cirros disk, kernel and ramdisk files and creates the
+        network and flavor used by the class' tests once
+        """
+        super(CreateInstanceMockOfflineTests, cls).setUpClass()
+
+        os_creds = cls.class_os_creds
+        if not os_creds:
+            os_creds = openstack_tests.get_credentials(
+                dev_os_env_file=dev_os_env_file)
+
+        guid = _guid(cls)
+        cls.network_creator = None
+        cls.flavor_creator = None
+
+        cls.tmpDir = 'tmp/' + guid
+        file_utils.make_dirs(cls.tmpDir)
+
+        try:
+            cls.image_file, cls.kernel_file, cls.ramdisk_file = \
+                _download_files(
+                    [openstack_tests.CIRROS_DEFAULT_IMAGE_URL,
+                     openstack_tests.CIRROS_DEFAULT_KERNEL_IMAGE_URL,
+                     openstack_tests.CIRROS_DEFAULT_RAMDISK_IMAGE_URL],
+                    cls.tmpDir)
+
+            priv_net_config = openstack_tests.get_priv_net_config(
+                net_name=guid + '-priv-net',
+                subnet_name=guid + '-priv-subnet')
+            cls.network_creator = _create_or_clean(
+                OpenStackNetwork(os_creds, priv_net_config.network_settings))
+
+            cls.flavor_creator = _create_or_clean(
+                OpenStackFlavor(
+                    os_creds,
+                    FlavorSettings(
+                        name=guid + '-flavor-name', ram=256, disk=10,
+                        vcpus=1)))
+        except Exception:
+            # tearDownClass() is not called when setUpClass() fails
+            cls.tearDownClass()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Cleans the network and flavor shared by the class' tests and removes
+        the files downloaded for them
+        """
+        _clean_creator(cls.network_creator, 'network')
+        _clean_creator(cls.flavor_creator, 'flavor')
+
+        cls.network_creator = None
+        cls.flavor_creator = None
+
+        if os.path.exists(cls.tmpDir) and os.path.isdir(cls.tmpDir):
+            shutil.rmtree(cls.tmpDir)
+
+        super(CreateInstanceMockOfflineTests, cls).tearDownClass()
 
     def setUp(self):
         """
         Instantiates the CreateImage object that is responsible for downloading
         and creating an OS image file within OpenStack
         """
-        self.guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
-
-        self.tmpDir = 'tmp/' + str(self.guid)
-        if not os.path.exists(self.tmpDir):
-            os.makedirs(self.tmpDir)
+        self.guid = _guid(self.__class__)
 
         self.image_name = self.guid + '-image'
         self.vm_inst_name = self.guid + '-inst'
@@ -1948,75 +1785,18 @@ class CreateInstanceMockOfflineTests(OSComponentTestCase):
 
         # Initialize for tearDown()
         self.image_creator = None
-        self.network_creator = None
-        self.flavor_creator = None
         self.inst_creator = None
 
-        self.priv_net_config = openstack_tests.get_priv_net_config(
-            net_name=self.guid + '-priv-net',
-            subnet_name=self.guid + '-priv-subnet')
         self.port_settings = PortSettings(
             name=self.port_1_name,
-            network_name=self.priv_net_config.network_settings.name)
-
-        try:
-            # Download image file
-            self.image_file = file_utils.download(
-                openstack_tests.CIRROS_DEFAULT_IMAGE_URL, self.tmpDir)
-
-            # Create Network
-            self.network_creator = OpenStackNetwork(
-                self.os_creds, self.priv_net_config.network_settings)
-            self.network_creator.create()
-
-            # Create Flavor
-            self.flavor_creator = OpenStackFlavor(
-                self.os_creds,
-                FlavorSettings(
-                    name=self.guid + '-flavor-name', ram=256, disk=10,
-                    vcpus=1))
-            self.flavor_creator.create()
-        except Exception as e:
-            self.tearDown()
-            raise e
+            network_name=self.network_creator.network_settings.name)
 
     def tearDown(self):
         """
         Cleans the created object
         """
-        if self.inst_creator:
-            try:
-                self.inst_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning VM instance with message - '
-                    '%s', e)
-
-        if self.network_creator:
-            try:
-                self.network_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning network with message - %s',
-                    e)
-
-        if self.flavor_creator:
-            try:
-                self.flavor_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning flavor with message - %s',
-                    e)
-
-        if self.image_creator:
-            try:
-                self.image_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning image with message - %s', e)
-
-        if os.path.exists(self.tmpDir) and os.path.isdir(self.tmpDir):
-            shutil.rmtree(self.tmpDir)
+        _clean_creator(self.inst_creator, 'VM instance')
+        _clean_creator(self.image_creator, 'image')
 
     def test_inst_from_file_image_simple_flat(self):
         """
@@ -2157,6 +1937,30 @@ class CreateInstanceMockOfflineTests(OSComponentTestCase):
 
         self.assertTrue(self.inst_creator.vm_active(block=True))
 
+    def __assert_3part_image_settings(self, os_image_settings):
+        """
+        Asserts that the disk, kernel and ramdisk image settings of a 3-part
+        image all reference the class' downloaded files
+        :param os_image_settings: the ImageSettings object to validate
+        """
+        expected = [
+            (os_image_settings, self.image_name, self.image_file),
+            (os_image_settings.kernel_image_settings,
+             self.image_name + '-kernel', self.kernel_file),
+            (os_image_settings.ramdisk_image_settings,
+             self.image_name + '-ramdisk', self.ramdisk_file)]
+
+        for image_settings, name, image_file in expected:
+            self.assertIsNotNone(image_settings)
+            self.assertEqual(name, image_settings.name)
+            self.assertEqual(image_file.name, image_settings.image_file)
+            self.assertEqual(openstack_tests.CIRROS_USER,
+                             image_settings.image_user)
+            self.assertIsNone(image_settings.url)
+            self.assertFalse(image_settings.exists)
+            self.assertEqual(openstack_tests.DEFAULT_IMAGE_FORMAT,
+                             image_settings.format)
+
     def test_inst_from_file_3part_image_complex(self):
         """
         Creates a VM instance from a locally sourced file image by overriding
@@ -2165,11 +1969,6 @@ class CreateInstanceMockOfflineTests(OSComponentTestCase):
         :return: 
         """
 
-        kernel_file = file_utils.download(
-            openstack_tests.CIRROS_DEFAULT_KERNEL_IMAGE_URL, self.tmpDir)
-        ramdisk_file = file_utils.download(
-            openstack_tests.CIRROS_DEFAULT_RAMDISK_IMAGE_URL, self.tmpDir)
-
         metadata = {
             'cirros': {
                 'config': {
@@ -2180,48 +1979,17 @@ class CreateInstanceMockOfflineTests(OSComponentTestCase):
                     'kernel_image_settings': {
                         'name': self.image_name + '-kernel',
                         'image_user': openstack_tests.CIRROS_USER,
-                        'image_file': kernel_file.name,
+                        'image_file': self.kernel_file.name,
                         'format': openstack_tests.DEFAULT_IMAGE_FORMAT},
                     'ramdisk_image_settings': {
                         'name': self.image_name + '-ramdisk',
                         'image_user': openstack_tests.CIRROS_USER,
-                        'image_file': ramdisk_file.name,
+                        'image_file': self.ramdisk_file.name,
                         'format': openstack_tests.DEFAULT_IMAGE_FORMAT}}}}
 
         os_image_settings = openstack_tests.cirros_image_settings(
             name=self.image_name, image_metadata=metadata)
-        self.assertEqual(self.image_name, os_image_settings.name)
-        self.assertEqual(self.image_file.name, os_image_settings.image_file)
-        self.assertEqual(openstack_tests.CIRROS_USER,
-                         os_image_settings.image_user)
-        self.assertIsNone(os_image_settings.url)
-        self.assertFalse(os_image_settings.exists)
-        self.assertEqual(openstack_tests.DEFAULT_IMAGE_FORMAT,
-                         os_image_settings.format)
-
-        self.assertIsNotNone(os_image_settings.kernel_image_settings)
-        self.assertEqual(self.image_name + '-kernel',
-                         os_image_settings.kernel_image_settings.name)
-        self.assertEqual(kernel_file.name,
-                         os_image_settings.kernel_image_settings.image_file)
-        self.assertEqual(openstack_tests.CIRROS_USER,
-                         os_image_settings.kernel_image_settings.image_user)
-        self.assertIsNone(os_image_settings.kernel_image_settings.url)
-        self.assertFalse(os_image_settings.kernel_image_settings.exists)
-        self.assertEqual(openstack_tests.DEFAULT_IMAGE_FORMAT,
-                         os_image_settings.kernel_image_settings.format)
-
-        self.assertIsNotNone(os_image_settings.ramdisk_image_settings)
-        self.assertEqual(self.image_name + '-ramdisk',
-                         os_image_settings.ramdisk_image_settings.name)
-        self.assertEqual(ramdisk_file.name,
-                         os_image_settings.ramdisk_image_settings.image_file)
-        self.assertEqual(openstack_tests.CIRROS_USER,
-                         os_image_settings.ramdisk_image_settings.image_user)
-        self.assertIsNone(os_image_settings.ramdisk_image_settings.url)
-        self.assertFalse(os_image_settings.ramdisk_image_settings.exists)
-        self.assertEqual(openstack_tests.DEFAULT_IMAGE_FORMAT,
-                         os_image_settings.ramdisk_image_settings.format)
+        self.__assert_3part_image_settings(os_image_settings)
 
         self.image_creator = OpenStackImage(self.os_creds, os_image_settings)
         self.image_creator.create()
@@ -2245,50 +2013,14 @@ class CreateInstanceMockOfflineTests(OSComponentTestCase):
         image settings
         :return: 
         """
-        kernel_file = file_utils.download(
-            openstack_tests.CIRROS_DEFAULT_KERNEL_IMAGE_URL, self.tmpDir)
-        ramdisk_file = file_utils.download(
-            openstack_tests.CIRROS_DEFAULT_RAMDISK_IMAGE_URL, self.tmpDir)
-
         metadata = {'disk_file': self.image_file.name,
-                    'kernel_file': kernel_file.name,
-                    'ramdisk_file': ramdisk_file.name}
+                    'kernel_file': self.kernel_file.name,
+                    'ramdisk_file': self.ramdisk_file.name}
 
         os_image_settings = openstack_tests.cirros_image_settings(
             name=self.image_name, image_metadata=metadata)
 
-        self.assertEqual(self.image_name, os_image_settings.name)
-        self.assertEqual(self.image_file.name, os_image_settings.image_file)
-        self.assertEqual(openstack_tests.CIRROS_USER,
-                         os_image_settings.image_user)
-        self.assertIsNone(os_image_settings.url)
-        self.assertFalse(os_image_settings.exists)
-        self.assertEqual(openstack_tests.DEFAULT_IMAGE_FORMAT,
-                         os_image_settings.format)
-
-        self.assertIsNotNone(os_image_settings.kernel_image_settings)
-        self.assertEqual(self.image_name + '-kernel',
-                         os_image_settings.kernel_image_settings.name)
-        self.assertEqual(kernel_file.name,
-                         os_image_settings.kernel_image_settings.image_file)
-        self.assertEqual(openstack_tests.CIRROS_USER,
-                         os_image_settings.kernel_image_settings.image_user)
-        self.assertIsNone(os_image_settings.kernel_image_settings.url)
-        self.assertFalse(os_image_settings.kernel_image_settings.exists)
-        self.assertEqual(openstack_tests.DEFAULT_IMAGE_FORMAT,
-                         os_image_settings.kernel_image_settings.format)
-
-        self.assertIsNotNone(os_image_settings.ramdisk_image_settings)
-        self.assertEqual(self.image_name + '-ramdisk',
-                         os_image_settings.ramdisk_image_settings.name)
-        self.assertEqual(ramdisk_file.name,
-                         os_image_settings.ramdisk_image_settings.image_file)
-        self.assertEqual(openstack_tests.CIRROS_USER,
-                         os_image_settings.ramdisk_image_settings.image_user)
-        self.assertIsNone(os_image_settings.ramdisk_image_settings.url)
-        self.assertFalse(os_image_settings.ramdisk_image_settings.exists)
-        self.assertEqual(openstack_tests.DEFAULT_IMAGE_FORMAT,
-                         os_image_settings.ramdisk_image_settings.format)
+        self.__assert_3part_image_settings(os_image_settings)
 
         self.image_creator = OpenStackImage(self.os_creds, os_image_settings)
         self.image_creator.create()
@@ -2315,50 +2047,14 @@ class CreateInstanceMockOfflineTests(OSComponentTestCase):
         completely overrides all image settings
         :return: 
         """
-        kernel_file = file_utils.download(
-            openstack_tests.CIRROS_DEFAULT_KERNEL_IMAGE_URL, self.tmpDir)
-        ramdisk_file = file_utils.download(
-            openstack_tests.CIRROS_DEFAULT_RAMDISK_IMAGE_URL, self.tmpDir)
-
         metadata = {'cirros': {'disk_file': self.image_file.name,
-                               'kernel_file': kernel_file.name,
-                               'ramdisk_file': ramdisk_file.name}}
+                               'kernel_file': self.kernel_file.name,
+                               'ramdisk_file': self.ramdisk_file.name}}
 
         os_image_settings = openstack_tests.cirros_image_settings(
             name=self.image_name, image_metadata=metadata)
 
-        self.assertEqual(self.image_name, os_image_settings.name)
-        self.assertEqual(self.image_file.name, os_image_settings.image_file)
-        self.assertEqual(openstack_tests.CIRROS_USER,
-                         os_image_settings.image_user)
-        self.assertIsNone(os_image_settings.url)
-        self.assertFalse(os_image_settings.exists)
-        self.assertEqual(openstack_tests.DEFAULT_IMAGE_FORMAT,
-                         os_image_settings.format)
-
-        self.assertIsNotNone(os_image_settings.kernel_image_settings)
-        self.assertEqual(self.image_name + '-kernel',
-                         os_image_settings.kernel_image_settings.name)
-        self.assertEqual(kernel_file.name,
-                         os_image_settings.kernel_image_settings.image_file)
-        self.assertEqual(openstack_tests.CIRROS_USER,
-                         os_image_settings.kernel_image_settings.image_user)
-        self.assertIsNone(os_image_settings.kernel_image_settings.url)
-        self.assertFalse(os_image_settings.kernel_image_settings.exists)
-        self.assertEqual(openstack_tests.DEFAULT_IMAGE_FORMAT,
-                         os_image_settings.kernel_image_settings.format)
-
-        self.assertIsNotNone(os_image_settings.ramdisk_image_settings)
-        self.assertEqual(self.image_name + '-ramdisk',
-                         os_image_settings.ramdisk_image_settings.name)
-        self.assertEqual(ramdisk_file.name,
-                         os_image_settings.ramdisk_image_settings.image_file)
-        self.assertEqual(openstack_tests.CIRROS_USER,
-                         os_image_settings.ramdisk_image_settings.image_user)
-        self.assertIsNone(os_image_settings.ramdisk_image_settings.url)
-        self.assertFalse(os_image_settings.ramdisk_image_settings.exists)
-        self.assertEqual(openstack_tests.DEFAULT_IMAGE_FORMAT,
-                         os_image_settings.ramdisk_image_settings.format)
+        self.__assert_3part_image_settings(os_image_settings)
 
         self.image_creator = OpenStackImage(self.os_creds, os_image_settings)
         self.image_creator.create()
@@ -2382,14 +2078,9 @@ class CreateInstanceMockOfflineTests(OSComponentTestCase):
         Creates a VM instance from a 3-part image that is existing
         :return: 
         """
-        kernel_file = file_utils.download(
-            openstack_tests.CIRROS_DEFAULT_KERNEL_IMAGE_URL, self.tmpDir)
-        ramdisk_file = file_utils.download(
-            openstack_tests.CIRROS_DEFAULT_RAMDISK_IMAGE_URL, self.tmpDir)
-
         metadata = {'cirros': {'disk_file': self.image_file.name,
-                               'kernel_file': kernel_file.name,
-                               'ramdisk_file': ramdisk_file.name}}
+                               'kernel_file': self.kernel_file.name,
+                               'ramdisk_file': self.ramdisk_file.name}}
 
         os_image_settings = openstack_tests.cirros_image_settings(
             name=self.image_name, image_metadata=metadata)
@@ -2429,7 +2120,7 @@ class CreateInstanceTwoNetTests(OSIntegrationTestCase):
         Instantiates the CreateImage object that is responsible for downloading
         and creating an OS image file within OpenStack
         """
-        super(self.__class__, self).__start__()
+        super(CreateInstanceTwoNetTests, self).__start__()
 
         cidr1 = '10.200.201.0/24'
         cidr2 = '10.200.202.0/24'
@@ -2438,8 +2129,6 @@ class CreateInstanceTwoNetTests(OSIntegrationTestCase):
         self.ip1 = '10.200.201.5'
         self.ip2 = '10.200.202.5'
 
-        self.nova = nova_utils.nova_client(self.os_creds)
-
         # Initialize for tearDown()
         self.image_creator = None
         self.network_creators = list()
@@ -2448,7 +2137,7 @@ class CreateInstanceTwoNetTests(OSIntegrationTestCase):
         self.sec_grp_creator = None
         self.inst_creators = list()
 
-        self.guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
+        self.guid = _guid(self.__class__)
         self.vm_inst1_name = self.guid + '-inst1'
         self.vm_inst2_name = self.guid + '-inst2'
         self.port_1_name = self.guid + '-vm1-port'
@@ -2456,37 +2145,51 @@ class CreateInstanceTwoNetTests(OSIntegrationTestCase):
         self.net_config_1 = NetworkSettings(
             name=self.guid + '-net1',
             subnet_settings=[
-                create_network.SubnetSettings(
+                SubnetSettings(
                     cidr=cidr1, name=self.guid + '-subnet1',
                     gateway_ip=static_gateway_ip1)])
         self.net_config_2 = NetworkSettings(
             name=self.guid + '-net2',
             subnet_settings=[
-                create_network.SubnetSettings(
+                SubnetSettings(
                     cidr=cidr2, name=self.guid + '-subnet2',
                     gateway_ip=static_gateway_ip2)])
 
-        image_name = self.__class__.__name__ + '-' + str(uuid.uuid4())
         os_image_settings = openstack_tests.cirros_image_settings(
-            name=image_name, image_metadata=self.image_metadata)
+            name=self.guid + '-image', image_metadata=self.image_metadata,
+            use_local_file=True)
+
+        sec_grp_name = self.guid + '-sec-grp'
+        rule1 = SecurityGroupRuleSettings(sec_grp_name=sec_grp_name,
+                                          direction=Direction.ingress,
+                                          protocol=Protocol.icmp)
 
         try:
-            # Create Image
             self.image_creator = OpenStackImage(self.os_creds,
                                                 os_image_settings)
-            self.image_creator.create()
-
             # First network is public
             self.network_creators.append(OpenStackNetwork(
                 self.os_creds, self.net_config_1))
             # Second network is private
             self.network_creators.append(OpenStackNetwork(
                 self.os_creds, self.net_config_2))
-            for network_creator in self.network_creators:
-                network_creator.create()
+            self.flavor_creator = OpenStackFlavor(
+                self.admin_os_creds,
+                FlavorSettings(name=self.guid + '-flavor-name', ram=512,
+                               disk=10, vcpus=2,
+                               metadata=self.flavor_metadata))
+            self.sec_grp_creator = OpenStackSecurityGroup(
+                self.os_creds,
+                SecurityGroupSettings(name=sec_grp_name,
+                                      rule_settings=[rule1]))
+
+            # Create the Image, Networks, Flavor and Security Group
+            # concurrently as only the router depends on any of them
+            _create_creators([self.image_creator, self.flavor_creator,
+                              self.sec_grp_creator] + self.network_creators)
 
             port_settings = [
-                create_network.PortSettings(
+                PortSettings(
                     name=self.guid + '-router-port1',
                     ip_addrs=[{
                         'subnet_name':
@@ -2495,7 +2198,7 @@ class CreateInstanceTwoNetTests(OSIntegrationTestCase):
                     }],
                     network_name=self.net_config_1.name,
                     project_name=self.os_creds.project_name),
-                create_network.PortSettings(
+                PortSettings(
                     name=self.guid + '-router-port2',
                     ip_addrs=[{
                         'subnet_name':
@@ -2507,27 +2210,9 @@ class CreateInstanceTwoNetTests(OSIntegrationTestCase):
 
             router_settings = RouterSettings(name=self.guid + '-pub-router',
                                              port_settings=port_settings)
-            self.router_creator = create_router.OpenStackRouter(
+            self.router_creator = OpenStackRouter(
                 self.os_creds, router_settings)
             self.router_creator.create()
-
-            # Create Flavor
-            self.flavor_creator = OpenStackFlavor(
-                self.admin_os_creds,
-                FlavorSettings(name=self.guid + '-flavor-name', ram=512,
-                               disk=10, vcpus=2,
-                               metadata=self.flavor_metadata))
-            self.flavor_creator.create()
-
-            sec_grp_name = self.guid + '-sec-grp'
-            rule1 = SecurityGroupRuleSettings(sec_grp_name=sec_grp_name,
-                                              direction=Direction.ingress,
-                                              protocol=Protocol.icmp)
-            self.sec_grp_creator = OpenStackSecurityGroup(
-                self.os_creds,
-                SecurityGroupSettings(name=sec_grp_name,
-                                      rule_settings=[rule1]))
-            self.sec_grp_creator.create()
         except:
             self.tearDown()
             raise
@@ -2536,54 +2221,20 @@ class CreateInstanceTwoNetTests(OSIntegrationTestCase):
         """
         Cleans the created objects
         """
-        for inst_creator in self.inst_creators:
-            try:
-                inst_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning VM instance with message '
-                    '- %s', e)
-
-        if self.flavor_creator:
-            try:
-                self.flavor_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning flavor with message - %s',
-                    e)
-
-        if self.router_creator:
-            try:
-                self.router_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning router with message - %s',
-                    e)
-
-        for network_creator in self.network_creators:
-            try:
-                network_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning network with message - %s',
-                    e)
-
-        if self.sec_grp_creator:
-            try:
-                self.sec_grp_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning security group with message'
-                    ' - %s', e)
+        _clean_creators(self.inst_creators, 'VM instance')
 
+        image_creator = None
         if self.image_creator and not self.image_creator.image_settings.exists:
-            try:
-                self.image_creator.clean()
-            except Exception as e:
-                logger.error(
-                    'Unexpected exception cleaning image with message - %s', e)
+            image_creator = self.image_creator
+
+        # The router's ports must be gone before the networks can be deleted
+        _clean_in_parallel((self.router_creator, 'router'),
+                           (self.flavor_creator, 'flavor'),
+                           (self.sec_grp_creator, 'security group'),
+                           (image_creator, 'image'))
+        _clean_creators(self.network_creators, 'network')
 
-        super(self.__class__, self).__clean__()
+        super(CreateInstanceTwoNetTests, self).__clean__()
 
     def test_ping_via_router(self):
         """
@@ -2592,51 +2243,31 @@ class CreateInstanceTwoNetTests(OSIntegrationTestCase):
         can ping
         through
         """
-        # Create ports/NICs for instance
-        ports_settings = []
-        ctr = 1
-        for network_creator in self.network_creators:
-            ports_settings.append(PortSettings(
-                name=self.guid + '-port-' + str(ctr),
-                network_name=network_creator.network_settings.name))
-            ctr += 1
-
-        # Configure instances
-        instance1_settings = VmInstanceSettings(
-            name=self.vm_inst1_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            userdata=_get_ping_userdata(self.ip2),
-            port_settings=[PortSettings(
-                name=self.port_1_name,
-                ip_addrs=[{
-                    'subnet_name':
-                        self.net_config_1.subnet_settings[0].name,
-                    'ip': self.ip1
-                }],
-                network_name=self.network_creators[0].network_settings.name)])
-        instance2_settings = VmInstanceSettings(
-            name=self.vm_inst2_name,
-            flavor=self.flavor_creator.flavor_settings.name,
-            userdata=_get_ping_userdata(self.ip1),
-            port_settings=[PortSettings(
-                name=self.port_2_name,
-                ip_addrs=[{
-                    'subnet_name':
-                        self.net_config_2.subnet_settings[0].name,
-                    'ip': self.ip2
-                }],
-                network_name=self.network_creators[1].network_settings.name)])
+        # Each instance is configured to ping the IP of the other
+        inst_specs = [
+            (self.vm_inst1_name, self.port_1_name, self.net_config_1,
+             self.ip1, self.ip2),
+            (self.vm_inst2_name, self.port_2_name, self.net_config_2,
+             self.ip2, self.ip1)]
 
         # Create instances
-        self.inst_creators.append(OpenStackVmInstance(
-            self.os_creds, instance1_settings,
-            self.image_creator.image_settings))
-        self.inst_creators.append(OpenStackVmInstance(
-            self.os_creds, instance2_settings,
-            self.image_creator.image_settings))
+        for inst_name, port_name, net_config, ip, ping_ip in inst_specs:
+            instance_settings = VmInstanceSettings(
+                name=inst_name,
+                flavor=self.flavor_creator.flavor_settings.name,
+                userdata=_get_ping_userdata(ping_ip),
+                port_settings=[PortSettings(
+                    name=port_name,
+                    ip_addrs=[{
+                        'subnet_name': net_config.subnet_settings[0].name,
+                        'ip': ip
+                    }],
+                    network_name=net_config.name)])
+            self.inst_creators.append(OpenStackVmInstance(
+                self.os_creds, instance_settings,
+                self.image_creator.image_settings))
 
-        for inst_creator in self.inst_creators:
-            inst_creator.create(block=True)
+        _create_creators(self.inst_creators, block=True)
 
         # Check for DHCP lease
         self.assertTrue(check_dhcp_lease(self.inst_creators[0], self.ip1))
@@ -2659,14 +2290,18 @@ def check_dhcp_lease(inst_creator, ip, timeout=160):
     start_time = time.time()
 
     logger.info("Looking for IP %s in the console log" % ip)
+    # Match the whole address so 10.0.0.1 is not found within 10.0.0.10
+    ip_pattern = re.compile(r'\b%s\b' % re.escape(ip))
+
+    # Each query returns the whole console log so only the latest is kept
     full_log = ''
     while timeout > time.time() - start_time:
-        output = inst_creator.get_console_output()
-        full_log = full_log + output
-        if re.search(ip, output):
+        full_log = inst_creator.get_console_output()
+        if ip_pattern.search(full_log):
             logger.info('DHCP lease obtained logged in console')
             found = True
             break
+        time.sleep(1)
 
     if not found:
         logger.error('Full console output -\n' + full_log)
@@ -2702,15 +2337,14 @@ def check_ping(vm_creator, timeout=160):
     """
     Check for VM for ping result
     """
-    tries = 0
+    start_time = time.time()
 
-    while tries < timeout:
-        time.sleep(1)
+    while timeout > time.time() - start_time:
         p_console = vm_creator.get_console_output()
         if "vPing OK" in p_console:
             return True
-        elif "failed to read iid from metadata" in p_console or tries > 5:
+        elif "failed to read iid from metadata" in p_console:
             return False
-        tries += 1
+        time.sleep(1)
 
     return False
@@ -331,6 +331,20 @@ class PortSettingsUnitTests(unittest.TestCase):
         self.assertEqual('owner', settings.device_owner)
         self.assertEqual('device number', settings.device_id)
 
+    def test_invalid_addresses(self):
+        invalid_kwargs = [
+            {'mac_address': 'foo'},
+            {'ip_addrs': [{'subnet_name': 'foo-sub', 'ip': 'foo'}]},
+            {'allowed_address_pairs': [
+                {'ip_address': '10.0.0.101', 'mac_address': 'foo'}]},
+            {'allowed_address_pairs': [
+                {'ip_address': 'foo', 'mac_address': '0a:1b:2c:3d:4e:5f'}]}]
+        for kwargs in invalid_kwargs:
+            settings = PortSettings(name='foo', network_name='bar', **kwargs)
+            # Raised prior to any Neutron or Keystone calls
+            with self.assertRaises(PortSettingsError):
+                settings.dict_for_neutron(None, None)
+
 
 class CreateNetworkSuccessTests(OSIntegrationTestCase):
     """
@@ -19,6 +19,7 @@ try:
 except ImportError:
     from urllib2 import URLError
 
+import json
 import logging
 import unittest
 import uuid
@@ -106,6 +107,15 @@ class VolumeTypeSettingsUnitTests(unittest.TestCase):
                          settings.encryption)
         self.assertFalse(settings.public)
 
+    def test_control_location_str(self):
+        encryption_settings = VolumeTypeEncryptionSettings(
+            name='foo', provider_class='bar', control_location='front-end')
+        self.assertEqual(ControlLocation.front_end,
+                         encryption_settings.control_location)
+        self.assertEqual('front-end', encryption_settings.control_location)
+        self.assertEqual('"front-end"',
+                         json.dumps(encryption_settings.control_location))
+
 
 class CreateSimpleVolumeTypeSuccessTests(OSIntegrationTestCase):
     """
@@ -203,6 +213,24 @@ class CreateSimpleVolumeTypeSuccessTests(OSIntegrationTestCase):
         volume_type2 = os_volume_type_2.create()
         self.assertEqual(volume_type2, volume_type2)
 
+    def test_initialize_many(self):
+        """
+        Tests the loading of many volume types with one creator call where
+        only one of them exists
+        """
+        # Create VolumeType
+        self.volume_type_creator = create_volume_type.OpenStackVolumeType(
+            self.os_creds, self.volume_type_settings)
+        created_volume_type = self.volume_type_creator.create()
+
+        missing_settings = VolumeTypeSettings(
+            name=self.volume_type_settings.name + '-missing')
+        creators = create_volume_type.OpenStackVolumeType.initialize_many(
+            self.os_creds, [self.volume_type_settings, missing_settings])
+        self.assertEqual(2, len(creators))
+        self.assertEqual(created_volume_type, creators[0].get_volume_type())
+        self.assertIsNone(creators[1].get_volume_type())
+
 
 class CreateVolumeTypeComplexTests(OSIntegrationTestCase):
     """
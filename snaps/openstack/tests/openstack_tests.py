@@ -14,7 +14,9 @@
 # limitations under the License.
 import logging
 import re
+import uuid
 
+import os
 import pkg_resources
 from snaps import file_utils
 from snaps.openstack.create_image import ImageSettings
@@ -217,9 +219,27 @@ def create_image_settings(image_name, image_user, image_format, metadata,
                          nic_config_pb_loc=nic_config_pb_loc)
 
 
+def cirros_image_file(dest_path='./tmp'):
+    """
+    Returns the path to a local copy of the default Cirros disk image which is
+    only downloaded when it does not already exist
+    :param dest_path: the directory in which to keep the image file
+    :return: the file path
+    """
+    file_path = dest_path + '/' + CIRROS_DEFAULT_IMAGE_URL.rsplit('/')[-1]
+    if not file_utils.file_exists(file_path):
+        # Download to a unique name then rename so concurrent tests never
+        # upload a partially written file
+        tmp_file = file_utils.download(
+            CIRROS_DEFAULT_IMAGE_URL, dest_path,
+            os.path.basename(file_path) + '.' + str(uuid.uuid4()))
+        os.rename(tmp_file.name, file_path)
+    return file_path
+
+
 def cirros_image_settings(name=None, url=None, image_metadata=None,
                           kernel_settings=None, ramdisk_settings=None,
-                          public=False):
+                          public=False, use_local_file=False):
     """
     Returns the image settings for a Cirros QCOW2 image
     :param name: the name of the image
@@ -232,6 +252,10 @@ def cirros_image_settings(name=None, url=None, image_metadata=None,
                              image_metadata
     :param public: True denotes image can be used by other projects where False
                    indicates the converse
+    :param use_local_file: when True and neither url nor image_metadata have
+                           been set, the image is uploaded from the local copy
+                           returned by cirros_image_file() rather than being
+                           downloaded again from the default URL
     :return:
     """
     if image_metadata and 'cirros' in image_metadata:
@@ -239,6 +263,9 @@ def cirros_image_settings(name=None, url=None, image_metadata=None,
     else:
         metadata = image_metadata
 
+    if use_local_file and not url and not metadata:
+        metadata = {'disk_file': cirros_image_file()}
+
     return create_image_settings(
         image_name=name, image_user=CIRROS_USER,
         image_format=DEFAULT_IMAGE_FORMAT, metadata=metadata, disk_url=url,
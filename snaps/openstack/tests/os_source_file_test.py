@@ -23,7 +23,7 @@ from snaps import file_utils
 from snaps.openstack.create_project import ProjectSettings
 from snaps.openstack.create_user import UserSettings
 from snaps.openstack.tests import openstack_tests
-from snaps.openstack.utils import deploy_utils, keystone_utils
+from snaps.openstack.utils import deploy_utils, keystone_utils, nova_utils
 
 
 dev_os_env_file = pkg_resources.resource_filename(
@@ -65,6 +65,20 @@ class OSComponentTestCase(unittest.TestCase):
 
         self.image_metadata = image_metadata
 
+    @property
+    def nova(self):
+        """
+        Returns the Nova client for the test's current credentials. The client
+        is built on first access and again only once self.os_creds has been
+        replaced (e.g. by OSIntegrationTestCase.__start__())
+        :return: the Nova client
+        """
+        nova_creds, nova = getattr(self, '_nova_client', (None, None))
+        if nova is None or nova_creds is not self.os_creds:
+            nova = nova_utils.nova_client(self.os_creds)
+            self._nova_client = (self.os_creds, nova)
+        return nova
+
     @staticmethod
     def parameterize(testcase_klass, os_creds, ext_net_name,
                      image_metadata=None, log_level=logging.DEBUG):
@@ -166,6 +180,20 @@ class OSIntegrationTestCase(OSComponentTestCase):
             # add user to project
             self.project_creator.assoc_user(self.user_creator.get_user())
 
+    @property
+    def admin_nova(self):
+        """
+        Returns the Nova client for the admin credentials saved by __start__().
+        The client is built on first access and again only once
+        self.admin_os_creds has been replaced by a later __start__()
+        :return: the Nova client
+        """
+        nova_creds, nova = getattr(self, '_admin_nova_client', (None, None))
+        if nova is None or nova_creds is not self.admin_os_creds:
+            nova = nova_utils.nova_client(self.admin_os_creds)
+            self._admin_nova_client = (self.admin_os_creds, nova)
+        return nova
+
     def __clean__(self):
         """
         Cleans up test user and project.
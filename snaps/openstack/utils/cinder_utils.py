@@ -56,12 +56,29 @@ def get_volume_type(cinder, volume_type_name=None, volume_type_settings=None):
     if volume_type_settings:
         volume_type_name = volume_type_settings.name
 
+    return get_volume_types(cinder, [volume_type_name]).get(volume_type_name)
+
+
+def get_volume_types(cinder, volume_type_names):
+    """
+    Returns the OpenStack volume types for a collection of names with a
+    single list call to Cinder
+    :param cinder: the Cinder client
+    :param volume_type_names: the volume type names to lookup
+    :return: a dict of VolumeType domain objects keyed by name (names that
+             were not found are not contained in the dict)
+    """
+    names = set(volume_type_names)
+    out = dict()
+
     volume_types = cinder.volume_types.list()
     for vol_type in volume_types:
-        if vol_type.name == volume_type_name:
+        if vol_type.name in names and vol_type.name not in out:
             encryption = get_volume_encryption_by_type(cinder, vol_type)
-            return VolumeType(vol_type.name, vol_type.id, vol_type.is_public,
-                              encryption, None)
+            out[vol_type.name] = VolumeType(
+                vol_type.name, vol_type.id, vol_type.is_public, encryption,
+                None)
+    return out
 
 
 def __get_os_volume_type_by_id(cinder, volume_type_id):
@@ -229,6 +229,32 @@ def delete_image(glance, image):
     glance.images.delete(image.id)
 
 
+def add_image_member(glance, image, project_id):
+    """
+    Shares a non-public image with a project. With Glance v2 the project must
+    then accept the membership with accept_image_member() before the image is
+    listed for it
+    :param glance: the glance client of the image's owner
+    :param image: the SNAPS-OO domain Image object to share
+    :param project_id: the ID of the project with which to share the image
+    """
+    logger.info('Sharing image named - %s with project - %s', image.name,
+                project_id)
+    glance.image_members.create(image.id, project_id)
+
+
+def accept_image_member(glance, image, project_id):
+    """
+    Accepts an image shared by add_image_member(). Glance v1 memberships have
+    no status so this is only required with Glance v2
+    :param glance: the glance client of the project the image is shared with
+    :param image: the SNAPS-OO domain Image object to accept
+    :param project_id: the ID of the project with which the image is shared
+    """
+    if glance.version == VERSION_2:
+        glance.image_members.update(image.id, project_id, 'accepted')
+
+
 class GlanceException(Exception):
     """
     Exception when calls to the Glance client cannot be served properly
@@ -12,7 +12,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import logging
+import threading
 
 from keystoneclient.client import Client
 from keystoneauth1.identity import v3, v2
@@ -28,6 +30,11 @@ logger = logging.getLogger('keystone_utils')
 V2_VERSION_NUM = 2.0
 V2_VERSION_STR = 'v' + str(V2_VERSION_NUM)
 
+# Keystone sessions keyed by the credential values used to build them. Only
+# populated between calls to enable_session_cache() and clear_session_cache()
+_keystone_sessions = None
+_keystone_sessions_lock = threading.Lock()
+
 
 def get_session_auth(os_creds):
     """
@@ -52,11 +59,88 @@ def get_session_auth(os_creds):
     return auth
 
 
+def enable_session_cache():
+    """
+    Enables the caching of keystone sessions so all subsequent calls to
+    keystone_session() with equivalent credentials return the same session
+    (and therefore share one token) until clear_session_cache() is called.
+    Sessions are not cached by default.
+    """
+    global _keystone_sessions
+    with _keystone_sessions_lock:
+        if _keystone_sessions is None:
+            _keystone_sessions = dict()
+
+
+def is_session_cache_enabled():
+    """
+    Returns True when keystone sessions are being cached
+    :return: T/F
+    """
+    return _keystone_sessions is not None
+
+
+def clear_session_cache():
+    """
+    Evicts all cached keystone sessions and disables the cache
+    """
+    global _keystone_sessions
+    with _keystone_sessions_lock:
+        _keystone_sessions = None
+
+
+def __session_key(os_creds):
+    """
+    Returns a hashable key representing all of the credential values that
+    influence how a keystone session authenticates. The password is only
+    included as a digest so it is never held in the cache's keys
+    :param os_creds: The connection credentials to the OpenStack API
+    :return: a tuple
+    """
+    proxy_key = None
+    if os_creds.proxy_settings:
+        proxy = os_creds.proxy_settings
+        proxy_key = (proxy.host, proxy.port, proxy.https_host,
+                     proxy.https_port)
+
+    password_digest = None
+    if os_creds.password is not None:
+        password_digest = hashlib.sha256(
+            os_creds.password.encode('utf-8')).hexdigest()
+
+    return (os_creds.username, password_digest, os_creds.auth_url,
+            os_creds.project_name, os_creds.identity_api_version,
+            os_creds.user_domain_id, os_creds.user_domain_name,
+            os_creds.project_domain_id, os_creds.project_domain_name,
+            os_creds.cacert, proxy_key)
+
+
 def keystone_session(os_creds):
+    """
+    Returns a keystone session used for authenticating OpenStack clients.
+    A new session is created on each call unless enable_session_cache() has
+    been called in which case sessions are shared per set of credential
+    values; the session renews its token when it expires.
+    :param os_creds: The connection credentials to the OpenStack API
+    :return: the session object
+    """
+    with _keystone_sessions_lock:
+        if _keystone_sessions is None:
+            return __create_session(os_creds)
+
+        key = __session_key(os_creds)
+        key_session = _keystone_sessions.get(key)
+        if key_session is None:
+            key_session = __create_session(os_creds)
+            _keystone_sessions[key] = key_session
+        return key_session
+
+
+def __create_session(os_creds):
     """
     Creates a keystone session used for authenticating OpenStack clients
     :param os_creds: The connection credentials to the OpenStack API
-    :return: the client object
+    :return: the session object
     """
     logger.debug('Retrieving Keystone Session')
 
@@ -544,6 +544,25 @@ def create_security_group_rule(neutron, sec_grp_rule_settings):
     return SecurityGroupRule(**os_rule['security_group_rule'])
 
 
+def create_security_group_rules(neutron, sec_grp_rule_settings):
+    """
+    Creates security group rules in OpenStack with a single bulk request.
+    Neutron creates either all or none of the rules
+    :param neutron: the client
+    :param sec_grp_rule_settings: the list of security group rule settings
+    :return: the list of SNAPS-OO SecurityGroupRule domain objects in the
+             same order as sec_grp_rule_settings
+    """
+    logger.info('Creating %s security group rules',
+                len(sec_grp_rule_settings))
+    os_rules = neutron.create_security_group_rule(
+        {'security_group_rules': [
+            rule_settings.dict_for_neutron(neutron)['security_group_rule']
+            for rule_settings in sec_grp_rule_settings]})
+    return [SecurityGroupRule(**os_rule)
+            for os_rule in os_rules['security_group_rules']]
+
+
 def delete_security_group_rule(neutron, sec_grp_rule):
     """
     Deletes a security group object from OpenStack
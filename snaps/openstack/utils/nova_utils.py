@@ -41,7 +41,10 @@ Utilities for basic OpenStack Nova API calls
 def nova_client(os_creds):
     """
     Instantiates and returns a client for communications with OpenStack's Nova
-    server
+    server. Each call returns a new client though clients built from
+    equivalent credentials share one keystone session (and token) while
+    keystone_utils.enable_session_cache() is in effect, as it is for the
+    duration of a test_runner run
     :param os_creds: The connection credentials to the OpenStack API
     :return: the client object
     """
@@ -378,19 +381,18 @@ def keypair_exists(nova, keypair_obj):
 
 def get_keypair_by_name(nova, name):
     """
-    Returns a list of all available keypairs
+    Returns a keypair by name
     :param nova: the Nova client
     :param name: the name of the keypair to lookup
     :return: the keypair object or None if not found
     """
-    keypairs = nova.keypairs.list()
-
-    for keypair in keypairs:
-        if keypair.name == name:
-            return Keypair(name=keypair.name, kp_id=keypair.id,
-                           public_key=keypair.public_key)
+    try:
+        keypair = nova.keypairs.get(name)
+    except NotFound:
+        return None
 
-    return None
+    return Keypair(name=keypair.name, kp_id=keypair.id,
+                   public_key=keypair.public_key)
 
 
 def delete_keypair(nova, key):
@@ -567,7 +569,7 @@ def add_security_group(nova, vm, security_group_name):
     :param vm: the OpenStack server object (VM) to alter
     :param security_group_name: the name of the security group to add
     """
-    nova.servers.add_security_group(str(vm.id), security_group_name)
+    nova.servers.add_security_group(vm.id, security_group_name)
 
 
 def remove_security_group(nova, vm, security_group):
@@ -577,7 +579,7 @@ def remove_security_group(nova, vm, security_group):
     :param vm: the OpenStack server object (VM) to alter
     :param security_group: the SNAPS SecurityGroup domain object to add
     """
-    nova.servers.remove_security_group(str(vm.id), security_group.name)
+    nova.servers.remove_security_group(vm.id, security_group.name)
 
 
 def add_floating_ip_to_server(nova, vm, floating_ip, ip_addr):
@@ -18,6 +18,7 @@ import shutil
 import uuid
 
 from snaps import file_utils
+from snaps.openstack.create_project import OpenStackProject, ProjectSettings
 from snaps.openstack.tests import openstack_tests
 
 from snaps.openstack.tests import validation_utils
@@ -69,6 +70,7 @@ class GlanceUtilsTests(OSComponentTestCase):
         guid = uuid.uuid4()
         self.image_name = self.__class__.__name__ + '-' + str(guid)
         self.image = None
+        self.project_creator = None
         self.glance = glance_utils.glance_client(self.os_creds)
         if self.image_metadata:
             self.glance_test_meta = self.image_metadata.get('glance_tests')
@@ -86,6 +88,9 @@ class GlanceUtilsTests(OSComponentTestCase):
         if self.image:
             glance_utils.delete_image(self.glance, self.image)
 
+        if self.project_creator:
+            self.project_creator.clean()
+
         if os.path.exists(self.tmp_dir) and os.path.isdir(self.tmp_dir):
             shutil.rmtree(self.tmp_dir)
 
@@ -137,3 +142,29 @@ class GlanceUtilsTests(OSComponentTestCase):
             self.glance, image_settings=file_image_settings)
         self.assertIsNotNone(image)
         validation_utils.objects_equivalent(self.image, image)
+
+    def test_add_image_member(self):
+        """
+        Tests the glance_utils.add_image_member() function shares a private
+        image with another project
+        """
+        if 'disk_file' not in self.glance_test_meta:
+            os_image_settings = openstack_tests.cirros_image_settings(
+                name=self.image_name, image_metadata=self.glance_test_meta)
+        else:
+            os_image_settings = openstack_tests.file_image_test_settings(
+                name=self.image_name,
+                file_path=self.glance_test_meta['disk_file'])
+
+        self.image = glance_utils.create_image(self.glance, os_image_settings)
+        self.assertIsNotNone(self.image)
+
+        self.project_creator = OpenStackProject(
+            self.os_creds, ProjectSettings(name=self.image_name + '-proj'))
+        project = self.project_creator.create()
+
+        glance_utils.add_image_member(self.glance, self.image, project.id)
+
+        member_ids = [member.member_id for member in
+                      self.glance.image_members.list(self.image.id)]
+        self.assertEqual([project.id], member_ids)
@@ -12,16 +12,84 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import unittest
 import uuid
 
 from snaps.openstack.create_project import ProjectSettings
 from snaps.openstack.create_user import UserSettings
+from snaps.openstack.os_credentials import OSCreds
 from snaps.openstack.tests.os_source_file_test import OSComponentTestCase
 from snaps.openstack.utils import keystone_utils, neutron_utils
 
 __author__ = 'spisarski'
 
 
+class KeystoneSessionCacheUnitTests(unittest.TestCase):
+    """
+    Tests the keystone session cache, which does not require a connection to
+    OpenStack as sessions only authenticate when first used
+    """
+
+    def setUp(self):
+        # test_runner enables the cache for the whole run so it is restored
+        # once each test has completed
+        self.cache_enabled = keystone_utils.is_session_cache_enabled()
+        keystone_utils.clear_session_cache()
+        self.os_creds = OSCreds(username='user', password='pass',
+                                auth_url='http://foo:5000/v3',
+                                project_name='project')
+
+    def tearDown(self):
+        keystone_utils.clear_session_cache()
+        if self.cache_enabled:
+            keystone_utils.enable_session_cache()
+
+    def test_session_not_cached(self):
+        """
+        Tests to ensure that a new session is returned for each call when the
+        session cache has not been enabled.
+        """
+        session1 = keystone_utils.keystone_session(self.os_creds)
+        session2 = keystone_utils.keystone_session(self.os_creds)
+        self.assertIsNot(session1, session2)
+
+    def test_session_cached(self):
+        """
+        Tests to ensure that the same session is returned for equivalent
+        credentials while the session cache is enabled.
+        """
+        keystone_utils.enable_session_cache()
+        session1 = keystone_utils.keystone_session(self.os_creds)
+        session2 = keystone_utils.keystone_session(
+            OSCreds(username='user', password='pass',
+                    auth_url='http://foo:5000/v3', project_name='project'))
+        self.assertIs(session1, session2)
+
+    def test_session_cached_per_creds(self):
+        """
+        Tests to ensure that credentials with a different password do not
+        share a cached session.
+        """
+        keystone_utils.enable_session_cache()
+        session1 = keystone_utils.keystone_session(self.os_creds)
+        session2 = keystone_utils.keystone_session(
+            OSCreds(username='user', password='other',
+                    auth_url='http://foo:5000/v3', project_name='project'))
+        self.assertIsNot(session1, session2)
+
+    def test_clear_session_cache(self):
+        """
+        Tests to ensure that clearing the session cache evicts the cached
+        sessions.
+        """
+        keystone_utils.enable_session_cache()
+        session1 = keystone_utils.keystone_session(self.os_creds)
+        keystone_utils.clear_session_cache()
+        keystone_utils.enable_session_cache()
+        session2 = keystone_utils.keystone_session(self.os_creds)
+        self.assertIsNot(session1, session2)
+
+
 class KeystoneSmokeTests(OSComponentTestCase):
     """
     Tests to ensure that the neutron client can communicate with the cloud
@@ -40,8 +108,6 @@ class KeystoneSmokeTests(OSComponentTestCase):
         """
         Tests to ensure that the improper credentials cannot connect.
         """
-        from snaps.openstack.os_credentials import OSCreds
-
         with self.assertRaises(Exception):
             keystone = keystone_utils.keystone_client(OSCreds(
                 username='user', password='pass', auth_url='url',
@@ -149,8 +215,6 @@ class KeystoneUtilsTests(OSComponentTestCase):
         Tests to ensure that improper credentials and proper service type
         cannot succeed.
         """
-        from snaps.openstack.os_credentials import OSCreds
-
         with self.assertRaises(Exception):
             keystone_utils.get_endpoint(
                 OSCreds(username='user', password='pass', auth_url='url',
@@ -18,7 +18,7 @@ from snaps.openstack import create_router
 from snaps.openstack.create_network import NetworkSettings, SubnetSettings, \
     PortSettings
 from snaps.openstack.create_security_group import SecurityGroupSettings, \
-    SecurityGroupRuleSettings, Direction
+    SecurityGroupRuleSettings, Direction, Protocol
 from snaps.openstack.tests import openstack_tests
 from snaps.openstack.tests import validation_utils
 from snaps.openstack.tests.os_source_file_test import OSComponentTestCase
@@ -755,6 +755,41 @@ class NeutronUtilsSecurityGroupTests(OSComponentTestCase):
         self.assertIsNotNone(sec_grp_get)
         self.assertEqual(security_group, sec_grp_get)
 
+    def test_create_sec_grp_rules_bulk(self):
+        """
+        Tests the neutron_utils.create_security_group_rules() function
+        """
+        sec_grp_settings = SecurityGroupSettings(name=self.sec_grp_name,
+                                                 description='hello group')
+        self.security_groups.append(
+            neutron_utils.create_security_group(self.neutron, self.keystone,
+                                                sec_grp_settings))
+        free_rules = neutron_utils.get_rules_by_security_group(
+            self.neutron, self.security_groups[0])
+        for free_rule in free_rules:
+            self.security_group_rules.append(free_rule)
+
+        rule_settings = [
+            SecurityGroupRuleSettings(
+                sec_grp_name=self.sec_grp_name, direction=Direction.ingress,
+                protocol=Protocol.icmp),
+            SecurityGroupRuleSettings(
+                sec_grp_name=self.sec_grp_name, direction=Direction.ingress,
+                protocol=Protocol.tcp, port_range_min=22, port_range_max=22)]
+        custom_rules = neutron_utils.create_security_group_rules(
+            self.neutron, rule_settings)
+        self.security_group_rules.extend(custom_rules)
+
+        self.assertEqual(len(rule_settings), len(custom_rules))
+        for rule_setting, custom_rule in zip(rule_settings, custom_rules):
+            self.assertTrue(rule_setting.rule_eq(custom_rule))
+
+        rules = neutron_utils.get_rules_by_security_group(
+            self.neutron, self.security_groups[0])
+        self.assertTrue(
+            validation_utils.objects_equivalent(
+                self.security_group_rules, rules))
+
     def test_get_sec_grp_by_id(self):
         """
         Tests the neutron_utils.create_security_group() function
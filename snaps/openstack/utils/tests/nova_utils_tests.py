@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+import unittest
 import uuid
 
 import os
@@ -24,15 +25,49 @@ from snaps.openstack.create_flavor import FlavorSettings, OpenStackFlavor
 from snaps.openstack.create_image import OpenStackImage
 from snaps.openstack.create_instance import VmInstanceSettings
 from snaps.openstack.create_network import OpenStackNetwork, PortSettings
+from snaps.openstack.os_credentials import OSCreds
 from snaps.openstack.tests import openstack_tests
 from snaps.openstack.tests.os_source_file_test import OSComponentTestCase
-from snaps.openstack.utils import nova_utils, neutron_utils, glance_utils
+from snaps.openstack.utils import (
+    nova_utils, neutron_utils, glance_utils, keystone_utils)
 
 __author__ = 'spisarski'
 
 logger = logging.getLogger('nova_utils_tests')
 
 
+class NovaClientSessionUnitTests(unittest.TestCase):
+    """
+    Tests the keystone sessions used by Nova clients, which does not require a
+    connection to OpenStack as a client only authenticates when first used
+    """
+
+    def setUp(self):
+        # test_runner enables the cache for the whole run so it is restored
+        # once each test has completed
+        self.cache_enabled = keystone_utils.is_session_cache_enabled()
+        keystone_utils.clear_session_cache()
+        self.os_creds = OSCreds(username='user', password='pass',
+                                auth_url='http://foo:5000/v3',
+                                project_name='project')
+
+    def tearDown(self):
+        keystone_utils.clear_session_cache()
+        if self.cache_enabled:
+            keystone_utils.enable_session_cache()
+
+    def test_nova_client_shares_cached_session(self):
+        """
+        Tests to ensure that Nova clients built from equivalent credentials
+        share one keystone session while the session cache is enabled.
+        """
+        keystone_utils.enable_session_cache()
+        nova1 = nova_utils.nova_client(self.os_creds)
+        nova2 = nova_utils.nova_client(self.os_creds)
+        self.assertIsNot(nova1, nova2)
+        self.assertIs(nova1.client.session, nova2.client.session)
+
+
 class NovaSmokeTests(OSComponentTestCase):
     """
     Tests to ensure that the nova client can communicate with the cloud
@@ -78,7 +113,6 @@ class NovaUtilsKeypairTests(OSComponentTestCase):
         self.priv_key_file_path = 'tmp/' + guid
         self.pub_key_file_path = self.priv_key_file_path + '.pub'
 
-        self.nova = nova_utils.nova_client(self.os_creds)
         self.keys = nova_utils.create_keys()
         self.public_key = nova_utils.public_key_openssh(self.keys)
         self.keypair_name = guid
@@ -161,7 +195,6 @@ class NovaUtilsFlavorTests(OSComponentTestCase):
                                               disk=1, vcpus=1,
                                               ephemeral=1, swap=2,
                                               rxtx_factor=3.0, is_public=False)
-        self.nova = nova_utils.nova_client(self.os_creds)
         self.flavor = None
 
     def tearDown(self):
@@ -227,7 +260,6 @@ class NovaUtilsInstanceTests(OSComponentTestCase):
 
         guid = self.__class__.__name__ + '-' + str(uuid.uuid4())
 
-        self.nova = nova_utils.nova_client(self.os_creds)
         self.neutron = neutron_utils.neutron_client(self.os_creds)
         self.glance = glance_utils.glance_client(self.os_creds)
 
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+import socket
 
 from collections import namedtuple
 
@@ -99,7 +100,8 @@ def apply_playbook(playbook_path, hosts_inv, host_user, ssh_priv_key_file_path,
     return executor.run()
 
 
-def ssh_client(ip, user, private_key_filepath, proxy_settings=None):
+def ssh_client(ip, user, private_key_filepath, proxy_settings=None,
+               timeout=10):
     """
     Retrieves and attemts an SSH connection
     :param ip: the IP of the host to connect
@@ -107,6 +109,8 @@ def ssh_client(ip, user, private_key_filepath, proxy_settings=None):
     :param private_key_filepath: the path to the private key file
     :param proxy_settings: instance of os_credentials.ProxySettings class
                            (optional)
+    :param timeout: the seconds to wait for the TCP connection to port 22
+                    (default 10)
     :return: the SSH client if can connect else false
     """
     logger.debug('Retrieving SSH client')
@@ -119,10 +123,15 @@ def ssh_client(ip, user, private_key_filepath, proxy_settings=None):
             proxy_cmd_str = str(proxy_settings.ssh_proxy_cmd.replace('%h', ip))
             proxy_cmd_str = proxy_cmd_str.replace("%p", '22')
             proxy_cmd = paramiko.ProxyCommand(proxy_cmd_str)
+        else:
+            # Avoid a full SSH handshake attempt while the host is not yet
+            # accepting connections, which is the common case when polling a
+            # booting VM
+            socket.create_connection((ip, 22), timeout).close()
 
         pk_abs_path = os.path.expanduser(private_key_filepath)
         ssh.connect(ip, username=user, key_filename=pk_abs_path,
-                    sock=proxy_cmd)
+                    sock=proxy_cmd, timeout=timeout)
         return ssh
     except Exception as e:
         logger.warning('Unable to connect via SSH with message - ' + str(e))
@@ -15,10 +15,19 @@
 import argparse
 import json
 import logging
+import sys
+import threading
+import time
 import unittest
 
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 from snaps import test_suite_builder, file_utils
 from snaps.openstack.tests import openstack_tests
+from snaps.openstack.utils import keystone_utils
 
 __author__ = 'spisarski'
 
@@ -110,6 +119,143 @@ def __create_test_suite(
     return suite
 
 
+def __split_suite(suite):
+    """
+    Splits a test suite into the list of suites that were added to it at the
+    top level (i.e. one per parameterize() or loadTestsFromTestCase() call),
+    preserving the order in which they were added. The same test class may
+    therefore appear in more than one of the returned suites when it has been
+    added with different parameters
+    :param suite: the unittest.TestSuite to split
+    :return: a list of unittest.TestSuite objects
+    """
+    out = list()
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            out.append(test)
+        else:
+            out.append(unittest.TestSuite([test]))
+    return out
+
+
+def __suite_classes(suite):
+    """
+    Returns the set of test classes contained within a test suite
+    :param suite: the unittest.TestSuite to inspect
+    :return: a set of classes
+    """
+    out = set()
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            out.update(__suite_classes(test))
+        else:
+            out.add(test.__class__)
+    return out
+
+
+def __print_summary(result, time_taken, stream):
+    """
+    Writes a single summary of a combined test result in the same format as
+    unittest.TextTestRunner
+    :param result: the combined unittest.TestResult
+    :param time_taken: the total run time in seconds
+    :param stream: the stream to write the summary to
+    """
+    stream.write(unittest.TextTestResult.separator2 + '\n')
+    stream.write('Ran %d test%s in %.3fs\n\n' % (
+        result.testsRun, result.testsRun != 1 and 's' or '', time_taken))
+
+    infos = list()
+    if result.failures:
+        infos.append('failures=%d' % len(result.failures))
+    if result.errors:
+        infos.append('errors=%d' % len(result.errors))
+    if result.skipped:
+        infos.append('skipped=%d' % len(result.skipped))
+    if result.expectedFailures:
+        infos.append('expected failures=%d' % len(result.expectedFailures))
+    if result.unexpectedSuccesses:
+        infos.append(
+            'unexpected successes=%d' % len(result.unexpectedSuccesses))
+
+    if result.wasSuccessful():
+        stream.write('OK')
+    else:
+        stream.write('FAILED')
+    if infos:
+        stream.write(' (%s)' % ', '.join(infos))
+    stream.write('\n')
+    stream.flush()
+
+
+def __run_suite(suite, num_threads):
+    """
+    Runs the test suite. When num_threads is greater than 1, the suite is
+    split into the suites added to it at the top level and up to num_threads
+    of them are executed concurrently. Each of these keeps its own tests
+    serial and no two suites containing the same test class are run at the
+    same time so setUpClass/tearDownClass and any class scoped OpenStack
+    objects still behave as they do in a serial run. The output of each suite
+    is buffered and written to stderr once the suite completes.
+    :param suite: the unittest.TestSuite to run
+    :param num_threads: the maximum number of suites to run at once
+    :return: a unittest.TestResult containing the combined results
+    """
+    if num_threads <= 1:
+        return unittest.TextTestRunner(verbosity=2).run(suite)
+
+    pending = __split_suite(suite)
+    running_classes = set()
+    combined = unittest.TestResult()
+    condition = threading.Condition()
+
+    def next_suite():
+        for index, sub_suite in enumerate(pending):
+            classes = __suite_classes(sub_suite)
+            if not classes & running_classes:
+                del pending[index]
+                return sub_suite, classes
+        return None, None
+
+    def worker():
+        while True:
+            with condition:
+                sub_suite, classes = next_suite()
+                while not sub_suite:
+                    if not pending:
+                        return
+                    condition.wait()
+                    sub_suite, classes = next_suite()
+                running_classes.update(classes)
+
+            stream = StringIO()
+            result = unittest.TextTestRunner(
+                stream=stream, verbosity=2).run(sub_suite)
+
+            with condition:
+                running_classes.difference_update(classes)
+                sys.stderr.write(stream.getvalue())
+                sys.stderr.flush()
+                combined.errors.extend(result.errors)
+                combined.failures.extend(result.failures)
+                combined.skipped.extend(result.skipped)
+                combined.expectedFailures.extend(result.expectedFailures)
+                combined.unexpectedSuccesses.extend(
+                    result.unexpectedSuccesses)
+                combined.testsRun += result.testsRun
+                condition.notify_all()
+
+    start_time = time.time()
+    threads = [threading.Thread(target=worker) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    __print_summary(combined, time.time() - start_time, sys.stderr)
+    return combined
+
+
 def main(arguments):
     """
     Begins running unit tests.
@@ -157,7 +303,13 @@ def main(arguments):
 
     i = 0
     while i < int(arguments.num_runs):
-        result = unittest.TextTestRunner(verbosity=2).run(suite)
+        # Share one keystone session (and token) per set of credentials
+        # between all of the clients created during the run
+        keystone_utils.enable_session_cache()
+        try:
+            result = __run_suite(suite, int(arguments.num_threads))
+        finally:
+            keystone_utils.clear_session_cache()
         i += 1
 
         if result.errors:
@@ -247,6 +399,9 @@ if __name__ == '__main__':
     parser.add_argument(
         '-r', '--num-runs', dest='num_runs', default=1,
         help='Number of test runs to execute (default 1)')
+    parser.add_argument(
+        '-t', '--threads', dest='num_threads', default=1,
+        help='Number of test classes to execute concurrently (default 1)')
 
     args = parser.parse_args()
 
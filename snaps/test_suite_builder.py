@@ -84,14 +84,14 @@ from snaps.openstack.utils.tests.heat_utils_tests import (
     HeatSmokeTests, HeatUtilsCreateSimpleStackTests,
     HeatUtilsCreateComplexStackTests)
 from snaps.openstack.utils.tests.keystone_utils_tests import (
-    KeystoneSmokeTests, KeystoneUtilsTests)
+    KeystoneSmokeTests, KeystoneUtilsTests, KeystoneSessionCacheUnitTests)
 from snaps.openstack.utils.tests.neutron_utils_tests import (
     NeutronSmokeTests, NeutronUtilsNetworkTests, NeutronUtilsSubnetTests,
     NeutronUtilsRouterTests, NeutronUtilsSecurityGroupTests,
     NeutronUtilsFloatingIpTests)
 from snaps.openstack.utils.tests.nova_utils_tests import (
     NovaSmokeTests, NovaUtilsKeypairTests, NovaUtilsFlavorTests,
-    NovaUtilsInstanceTests)
+    NovaUtilsInstanceTests, NovaClientSessionUnitTests)
 from snaps.provisioning.tests.ansible_utils_tests import (
     AnsibleProvisioningTests)
 from snaps.tests.file_utils_tests import FileUtilsTests
@@ -112,6 +112,10 @@ def add_unit_tests(suite):
         ProxySettingsUnitTests))
     suite.addTest(unittest.TestLoader().loadTestsFromTestCase(
         OSCredsUnitTests))
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(
+        KeystoneSessionCacheUnitTests))
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(
+        NovaClientSessionUnitTests))
     suite.addTest(unittest.TestLoader().loadTestsFromTestCase(
         SecurityGroupSettingsUnitTests))
     suite.addTest(unittest.TestLoader().loadTestsFromTestCase(
@@ -558,7 +562,7 @@ def add_openstack_staging_tests(suite, os_creds, ext_net_name,
     suite.addTest(OSComponentTestCase.parameterize(
         CreateNetworkTypeTests, os_creds=os_creds, ext_net_name=ext_net_name,
         log_level=log_level))
-    suite.addTest(OSComponentTestCase.parameterize(
+    suite.addTest(CreateInstanceMockOfflineTests.parameterize(
         CreateInstanceMockOfflineTests, os_creds=os_creds,
         ext_net_name=ext_net_name, log_level=log_level))
     suite.addTest(OSIntegrationTestCase.parameterize(
@@ -117,6 +117,27 @@ class FileUtilsTests(unittest.TestCase):
         self.assertEqual('admin', os_env_dict['OS_USERNAME'])
         self.assertEqual('admin', os_env_dict['OS_TENANT_NAME'])
 
+    def test_make_dirs(self):
+        """
+        Ensure the file_utils.make_dirs() method creates missing parent
+        directories and does not fail when the directory already exists
+        """
+        nested_dir = self.test_dir + '/foo/bar'
+        file_utils.make_dirs(nested_dir)
+        self.assertTrue(os.path.isdir(nested_dir))
+
+        file_utils.make_dirs(nested_dir)
+        self.assertTrue(os.path.isdir(nested_dir))
+
+    def test_make_dirs_over_file(self):
+        """
+        Ensure the file_utils.make_dirs() method raises an OSError when the
+        path exists but is not a directory
+        """
+        file_utils.save_string_to_file('test string', self.tmpFile)
+        with self.assertRaises(OSError):
+            file_utils.make_dirs(self.tmpFile)
+
     def test_write_str_to_file(self):
         """
         Ensure the file_utils.fileExists() method returns false with a